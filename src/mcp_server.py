@@ -5,10 +5,26 @@ import json
 import logging
 import sys
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
 from dataclasses import asdict
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # optional: the stdlib json module is used without it
+    orjson = None
+
+try:
+    import ciso8601
+except ImportError:  # optional: datetime.fromisoformat is used without it
+    ciso8601 = None
+
+try:
+    import uvloop
+except ImportError:  # optional (and unavailable on Windows): the default asyncio loop is used without it
+    uvloop = None
+
 from .satellite_calc import SatelliteCalculator
 
 
@@ -21,6 +37,186 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Tool definitions returned by "tools/list", built once at import and
+# frozen, since every response shares them
+TOOLS = _freeze([
+    {
+        "name": "calculate_access_windows",
+        "description": "Calculate satellite access windows with lighting information",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "latitude": {"type": "number", "description": "Ground station latitude"},
+                "longitude": {"type": "number", "description": "Ground station longitude"},
+                "altitude": {"type": "number", "description": "Ground station altitude in meters", "default": 0},
+                "tle_line1": {"type": "string", "description": "TLE Line 1"},
+                "tle_line2": {"type": "string", "description": "TLE Line 2"},
+                "start_time": {"type": "string", "description": "Start time ISO 8601"},
+                "end_time": {"type": "string", "description": "End time ISO 8601"},
+                "elevation_threshold": {"type": "number", "default": 10.0, "description": "Minimum elevation angle in degrees"}
+            },
+            "required": ["latitude", "longitude", "tle_line1", "tle_line2", "start_time", "end_time"]
+        }
+    },
+    {
+        "name": "calculate_bulk_access_windows",
+        "description": "Calculate access windows from CSV data",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "locations_csv": {"type": "string", "description": "CSV content with locations"},
+                "satellites_csv": {"type": "string", "description": "CSV content with satellites"},
+                "start_time": {"type": "string", "description": "Start time ISO 8601"},
+                "end_time": {"type": "string", "description": "End time ISO 8601"},
+                "elevation_threshold": {"type": "number", "default": 10.0, "description": "Minimum elevation angle in degrees"}
+            },
+            "required": ["locations_csv", "satellites_csv", "start_time", "end_time"]
+        }
+    },
+    {
+        "name": "calculate_access_windows_by_city",
+        "description": "Calculate satellite access windows for a city by name lookup",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "city_name": {"type": "string", "description": "Name of the city"},
+                "tle_line1": {"type": "string", "description": "TLE Line 1"},
+                "tle_line2": {"type": "string", "description": "TLE Line 2"},
+                "start_time": {"type": "string", "description": "Start time ISO 8601"},
+                "end_time": {"type": "string", "description": "End time ISO 8601"},
+                "elevation_threshold": {"type": "number", "default": 10.0, "description": "Minimum elevation angle in degrees"}
+            },
+            "required": ["city_name", "tle_line1", "tle_line2", "start_time", "end_time"]
+        }
+    },
+    {
+        "name": "search_cities",
+        "description": "Search cities database functionality",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "City search query"},
+                "limit": {"type": "integer", "default": 10, "description": "Maximum number of results"}
+            },
+            "required": ["query"]
+        }
+    },
+    {
+        "name": "validate_tle",
+        "description": "TLE data validation",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "tle_line1": {"type": "string", "description": "TLE Line 1"},
+                "tle_line2": {"type": "string", "description": "TLE Line 2"}
+            },
+            "required": ["tle_line1", "tle_line2"]
+        }
+    },
+    {
+        "name": "calculate_access_windows_from_orbital_elements",
+        "description": "Calculate access windows from orbital parameters (inclination, altitude) with near-circular eccentricity",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "latitude": {"type": "number", "description": "Ground station latitude"},
+                "longitude": {"type": "number", "description": "Ground station longitude"},
+                "altitude_ground": {"type": "number", "description": "Ground station altitude in meters", "default": 0},
+                "inclination": {"type": "number", "description": "Orbital inclination in degrees"},
+                "altitude_km": {"type": "number", "description": "Satellite altitude in kilometers"},
+                "start_time": {"type": "string", "description": "Start time ISO 8601"},
+                "end_time": {"type": "string", "description": "End time ISO 8601"},
+                "elevation_threshold": {"type": "number", "default": 10.0, "description": "Minimum elevation angle in degrees"},
+                "eccentricity": {"type": "number", "default": 0.0001, "description": "Orbital eccentricity (defaults to near-circular)"},
+                "raan": {"type": "number", "default": 0.0, "description": "Right Ascension of Ascending Node in degrees"},
+                "arg_perigee": {"type": "number", "default": 0.0, "description": "Argument of perigee in degrees"},
+                "mean_anomaly": {"type": "number", "default": 0.0, "description": "Mean anomaly in degrees"}
+            },
+            "required": ["latitude", "longitude", "inclination", "altitude_km", "start_time", "end_time"]
+        }
+    },
+    {
+        "name": "calculate_access_windows_from_orbital_elements_by_city",
+        "description": "Calculate access windows from orbital parameters for a city by name",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "city_name": {"type": "string", "description": "Name of the city"},
+                "inclination": {"type": "number", "description": "Orbital inclination in degrees"},
+                "altitude_km": {"type": "number", "description": "Satellite altitude in kilometers"},
+                "start_time": {"type": "string", "description": "Start time ISO 8601"},
+                "end_time": {"type": "string", "description": "End time ISO 8601"},
+                "elevation_threshold": {"type": "number", "default": 10.0, "description": "Minimum elevation angle in degrees"},
+                "eccentricity": {"type": "number", "default": 0.0001, "description": "Orbital eccentricity (defaults to near-circular)"},
+                "raan": {"type": "number", "default": 0.0, "description": "Right Ascension of Ascending Node in degrees"},
+                "arg_perigee": {"type": "number", "default": 0.0, "description": "Argument of perigee in degrees"},
+                "mean_anomaly": {"type": "number", "default": 0.0, "description": "Mean anomaly in degrees"}
+            },
+            "required": ["city_name", "inclination", "altitude_km", "start_time", "end_time"]
+        }
+    },
+    {
+        "name": "calculate_satellite_to_satellite_access_windows",
+        "description": "Calculate access windows between satellites with Earth occlusion checking",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "satellites": {
+                    "type": "array",
+                    "description": "Array of satellite TLE data",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string", "description": "Satellite name"},
+                            "tle_line1": {"type": "string", "description": "TLE Line 1"},
+                            "tle_line2": {"type": "string", "description": "TLE Line 2"}
+                        },
+                        "required": ["name", "tle_line1", "tle_line2"]
+                    },
+                    "minItems": 2
+                },
+                "start_time": {"type": "string", "description": "Start time ISO 8601"},
+                "end_time": {"type": "string", "description": "End time ISO 8601"},
+                "min_separation_deg": {"type": "number", "default": 0.0, "description": "Minimum angular separation in degrees"},
+                "time_step_seconds": {"type": "integer", "default": 30, "description": "Time step for calculations in seconds"}
+            },
+            "required": ["satellites", "start_time", "end_time"]
+        }
+    },
+    {
+        "name": "calculate_bulk_satellite_to_satellite_access_windows",
+        "description": "Calculate access windows between satellites from CSV data",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "satellites_csv": {"type": "string", "description": "CSV content with satellite TLE data (columns: name, tle_line1, tle_line2)"},
+                "start_time": {"type": "string", "description": "Start time ISO 8601"},
+                "end_time": {"type": "string", "description": "End time ISO 8601"},
+                "min_separation_deg": {"type": "number", "default": 0.0, "description": "Minimum angular separation in degrees"},
+                "time_step_seconds": {"type": "integer", "default": 30, "description": "Time step for calculations in seconds"}
+            },
+            "required": ["satellites_csv", "start_time", "end_time"]
+        }
+    }
+])
+
+
+def _encode_mapping(obj: Any) -> Any:
+    """orjson default hook: encode read-only mappings (e.g. TOOLS) as objects."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
 class NumpyJSONEncoder(json.JSONEncoder):
     """Custom JSON encoder to handle numpy types."""
     
@@ -33,9 +229,52 @@ class NumpyJSONEncoder(json.JSONEncoder):
             return float(obj)
         elif isinstance(obj, np.ndarray):
             return obj.tolist()
+        elif isinstance(obj, datetime):
+            return obj.isoformat()
+        elif isinstance(obj, MappingProxyType):
+            return dict(obj)
         return super().default(obj)
 
 
+def _parse_iso_datetime(text: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC."""
+    if ciso8601 is not None:
+        return ciso8601.parse_datetime(text)
+    return datetime.fromisoformat(text.replace('Z', '+00:00'))
+
+
+def _loads(line: str) -> Any:
+    """Parse one JSON-RPC message (errors are json.JSONDecodeError either way)."""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def _dumps_line(message: Any) -> bytes:
+    """Serialize a JSON-RPC message as one newline-terminated UTF-8 line."""
+    if orjson is not None:
+        return orjson.dumps(
+            message, default=_encode_mapping, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return (json.dumps(message, cls=NumpyJSONEncoder) + "\n").encode()
+
+
+def _dumps_text(payload: Any) -> str:
+    """Serialize a tool result as indented JSON for a text content item."""
+    if orjson is not None:
+        return orjson.dumps(
+            payload,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(payload, indent=2, cls=NumpyJSONEncoder)
+
+
+def _write_message(message: Any) -> None:
+    """Write a JSON-RPC message to stdout and flush it."""
+    sys.stdout.buffer.write(_dumps_line(message))
+    sys.stdout.buffer.flush()
+
+
 class SatelliteMCPServer:
     """MCP-compatible server for satellite calculations."""
     
@@ -47,6 +286,19 @@ class SatelliteMCPServer:
             "version": "1.0.0",
             "description": "Satellite orbital mechanics calculations with natural language processing"
         }
+        
+        # Tool name -> coroutine handling its "tools/call" request
+        self._tool_handlers = {
+            "calculate_access_windows": self._calculate_access_windows,
+            "calculate_bulk_access_windows": self._calculate_bulk_access_windows,
+            "calculate_access_windows_by_city": self._calculate_access_windows_by_city,
+            "search_cities": self._search_cities,
+            "validate_tle": self._validate_tle,
+            "calculate_access_windows_from_orbital_elements": self._calculate_access_windows_from_orbital_elements,
+            "calculate_access_windows_from_orbital_elements_by_city": self._calculate_access_windows_from_orbital_elements_by_city,
+            "calculate_satellite_to_satellite_access_windows": self._calculate_satellite_to_satellite_access_windows,
+            "calculate_bulk_satellite_to_satellite_access_windows": self._calculate_bulk_satellite_to_satellite_access_windows
+        }
     
     async def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle JSON-RPC 2.0 request."""
@@ -65,196 +317,19 @@ class SatelliteMCPServer:
                     "serverInfo": self.server_info
                 }
             elif method == "tools/list":
-                result = {
-                    "tools": [
-                        {
-                            "name": "calculate_access_windows",
-                            "description": "Calculate satellite access windows with lighting information",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "latitude": {"type": "number", "description": "Ground station latitude"},
-                                    "longitude": {"type": "number", "description": "Ground station longitude"},
-                                    "altitude": {"type": "number", "description": "Ground station altitude in meters", "default": 0},
-                                    "tle_line1": {"type": "string", "description": "TLE Line 1"},
-                                    "tle_line2": {"type": "string", "description": "TLE Line 2"},
-                                    "start_time": {"type": "string", "description": "Start time ISO 8601"},
-                                    "end_time": {"type": "string", "description": "End time ISO 8601"},
-                                    "elevation_threshold": {"type": "number", "default": 10.0, "description": "Minimum elevation angle in degrees"}
-                                },
-                                "required": ["latitude", "longitude", "tle_line1", "tle_line2", "start_time", "end_time"]
-                            }
-                        },
-                        {
-                            "name": "calculate_bulk_access_windows",
-                            "description": "Calculate access windows from CSV data",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "locations_csv": {"type": "string", "description": "CSV content with locations"},
-                                    "satellites_csv": {"type": "string", "description": "CSV content with satellites"},
-                                    "start_time": {"type": "string", "description": "Start time ISO 8601"},
-                                    "end_time": {"type": "string", "description": "End time ISO 8601"},
-                                    "elevation_threshold": {"type": "number", "default": 10.0, "description": "Minimum elevation angle in degrees"}
-                                },
-                                "required": ["locations_csv", "satellites_csv", "start_time", "end_time"]
-                            }
-                        },
-                        {
-                            "name": "calculate_access_windows_by_city",
-                            "description": "Calculate satellite access windows for a city by name lookup",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "city_name": {"type": "string", "description": "Name of the city"},
-                                    "tle_line1": {"type": "string", "description": "TLE Line 1"},
-                                    "tle_line2": {"type": "string", "description": "TLE Line 2"},
-                                    "start_time": {"type": "string", "description": "Start time ISO 8601"},
-                                    "end_time": {"type": "string", "description": "End time ISO 8601"},
-                                    "elevation_threshold": {"type": "number", "default": 10.0, "description": "Minimum elevation angle in degrees"}
-                                },
-                                "required": ["city_name", "tle_line1", "tle_line2", "start_time", "end_time"]
-                            }
-                        },
-                        {
-                            "name": "search_cities",
-                            "description": "Search cities database functionality",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "query": {"type": "string", "description": "City search query"},
-                                    "limit": {"type": "integer", "default": 10, "description": "Maximum number of results"}
-                                },
-                                "required": ["query"]
-                            }
-                        },
-                        {
-                            "name": "validate_tle",
-                            "description": "TLE data validation",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "tle_line1": {"type": "string", "description": "TLE Line 1"},
-                                    "tle_line2": {"type": "string", "description": "TLE Line 2"}
-                                },
-                                "required": ["tle_line1", "tle_line2"]
-                            }
-                        },
-                        {
-                            "name": "calculate_access_windows_from_orbital_elements",
-                            "description": "Calculate access windows from orbital parameters (inclination, altitude) with near-circular eccentricity",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "latitude": {"type": "number", "description": "Ground station latitude"},
-                                    "longitude": {"type": "number", "description": "Ground station longitude"},
-                                    "altitude_ground": {"type": "number", "description": "Ground station altitude in meters", "default": 0},
-                                    "inclination": {"type": "number", "description": "Orbital inclination in degrees"},
-                                    "altitude_km": {"type": "number", "description": "Satellite altitude in kilometers"},
-                                    "start_time": {"type": "string", "description": "Start time ISO 8601"},
-                                    "end_time": {"type": "string", "description": "End time ISO 8601"},
-                                    "elevation_threshold": {"type": "number", "default": 10.0, "description": "Minimum elevation angle in degrees"},
-                                    "eccentricity": {"type": "number", "default": 0.0001, "description": "Orbital eccentricity (defaults to near-circular)"},
-                                    "raan": {"type": "number", "default": 0.0, "description": "Right Ascension of Ascending Node in degrees"},
-                                    "arg_perigee": {"type": "number", "default": 0.0, "description": "Argument of perigee in degrees"},
-                                    "mean_anomaly": {"type": "number", "default": 0.0, "description": "Mean anomaly in degrees"}
-                                },
-                                "required": ["latitude", "longitude", "inclination", "altitude_km", "start_time", "end_time"]
-                            }
-                        },
-                        {
-                            "name": "calculate_access_windows_from_orbital_elements_by_city",
-                            "description": "Calculate access windows from orbital parameters for a city by name",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "city_name": {"type": "string", "description": "Name of the city"},
-                                    "inclination": {"type": "number", "description": "Orbital inclination in degrees"},
-                                    "altitude_km": {"type": "number", "description": "Satellite altitude in kilometers"},
-                                    "start_time": {"type": "string", "description": "Start time ISO 8601"},
-                                    "end_time": {"type": "string", "description": "End time ISO 8601"},
-                                    "elevation_threshold": {"type": "number", "default": 10.0, "description": "Minimum elevation angle in degrees"},
-                                    "eccentricity": {"type": "number", "default": 0.0001, "description": "Orbital eccentricity (defaults to near-circular)"},
-                                    "raan": {"type": "number", "default": 0.0, "description": "Right Ascension of Ascending Node in degrees"},
-                                    "arg_perigee": {"type": "number", "default": 0.0, "description": "Argument of perigee in degrees"},
-                                    "mean_anomaly": {"type": "number", "default": 0.0, "description": "Mean anomaly in degrees"}
-                                },
-                                "required": ["city_name", "inclination", "altitude_km", "start_time", "end_time"]
-                            }
-                        },
-                        {
-                            "name": "calculate_satellite_to_satellite_access_windows",
-                            "description": "Calculate access windows between satellites with Earth occlusion checking",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "satellites": {
-                                        "type": "array",
-                                        "description": "Array of satellite TLE data",
-                                        "items": {
-                                            "type": "object",
-                                            "properties": {
-                                                "name": {"type": "string", "description": "Satellite name"},
-                                                "tle_line1": {"type": "string", "description": "TLE Line 1"},
-                                                "tle_line2": {"type": "string", "description": "TLE Line 2"}
-                                            },
-                                            "required": ["name", "tle_line1", "tle_line2"]
-                                        },
-                                        "minItems": 2
-                                    },
-                                    "start_time": {"type": "string", "description": "Start time ISO 8601"},
-                                    "end_time": {"type": "string", "description": "End time ISO 8601"},
-                                    "min_separation_deg": {"type": "number", "default": 0.0, "description": "Minimum angular separation in degrees"},
-                                    "time_step_seconds": {"type": "integer", "default": 30, "description": "Time step for calculations in seconds"}
-                                },
-                                "required": ["satellites", "start_time", "end_time"]
-                            }
-                        },
-                        {
-                            "name": "calculate_bulk_satellite_to_satellite_access_windows",
-                            "description": "Calculate access windows between satellites from CSV data",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "satellites_csv": {"type": "string", "description": "CSV content with satellite TLE data (columns: name, tle_line1, tle_line2)"},
-                                    "start_time": {"type": "string", "description": "Start time ISO 8601"},
-                                    "end_time": {"type": "string", "description": "End time ISO 8601"},
-                                    "min_separation_deg": {"type": "number", "default": 0.0, "description": "Minimum angular separation in degrees"},
-                                    "time_step_seconds": {"type": "integer", "default": 30, "description": "Time step for calculations in seconds"}
-                                },
-                                "required": ["satellites_csv", "start_time", "end_time"]
-                            }
-                        }
-                    ]
-                }
+                result = {"tools": TOOLS}
             elif method == "tools/call":
                 tool_name = params.get("name")
                 arguments = params.get("arguments", {})
                 
-                if tool_name == "calculate_access_windows":
-                    result = await self._calculate_access_windows(arguments)
-                elif tool_name == "calculate_bulk_access_windows":
-                    result = await self._calculate_bulk_access_windows(arguments)
-                elif tool_name == "calculate_access_windows_by_city":
-                    result = await self._calculate_access_windows_by_city(arguments)
-                elif tool_name == "search_cities":
-                    result = await self._search_cities(arguments)
-                elif tool_name == "validate_tle":
-                    result = await self._validate_tle(arguments)
-                elif tool_name == "calculate_access_windows_from_orbital_elements":
-                    result = await self._calculate_access_windows_from_orbital_elements(arguments)
-                elif tool_name == "calculate_access_windows_from_orbital_elements_by_city":
-                    result = await self._calculate_access_windows_from_orbital_elements_by_city(arguments)
-                elif tool_name == "calculate_satellite_to_satellite_access_windows":
-                    result = await self._calculate_satellite_to_satellite_access_windows(arguments)
-                elif tool_name == "calculate_bulk_satellite_to_satellite_access_windows":
-                    result = await self._calculate_bulk_satellite_to_satellite_access_windows(arguments)
-                else:
+                handler = self._tool_handlers.get(tool_name)
+                if handler is None:
                     return {
                         "jsonrpc": "2.0",
                         "id": request_id,
                         "error": {"code": -32601, "message": f"Unknown tool: {tool_name}"}
                     }
+                result = await handler(arguments)
             else:
                 return {
                     "jsonrpc": "2.0", 
@@ -281,11 +356,12 @@ class SatelliteMCPServer:
         city_name = arguments["city_name"]
         tle_line1 = arguments["tle_line1"]
         tle_line2 = arguments["tle_line2"]
-        start_time = datetime.fromisoformat(arguments["start_time"].replace('Z', '+00:00'))
-        end_time = datetime.fromisoformat(arguments["end_time"].replace('Z', '+00:00'))
+        start_time = _parse_iso_datetime(arguments["start_time"])
+        end_time = _parse_iso_datetime(arguments["end_time"])
         elevation_threshold = arguments.get("elevation_threshold", 10.0)
         
-        city_results = self.calculator.calculate_access_windows_by_city(
+        city_results = await asyncio.to_thread(
+            self.calculator.calculate_access_windows_by_city,
             city_name=city_name,
             tle_line1=tle_line1,
             tle_line2=tle_line2,
@@ -298,7 +374,7 @@ class SatelliteMCPServer:
             "content": [
                 {
                     "type": "text",
-                    "text": json.dumps(city_results, indent=2, cls=NumpyJSONEncoder)
+                    "text": _dumps_text(city_results)
                 }
             ]
         }
@@ -310,11 +386,12 @@ class SatelliteMCPServer:
         altitude = arguments.get("altitude", 0)
         tle_line1 = arguments["tle_line1"]
         tle_line2 = arguments["tle_line2"]
-        start_time = datetime.fromisoformat(arguments["start_time"].replace('Z', '+00:00'))
-        end_time = datetime.fromisoformat(arguments["end_time"].replace('Z', '+00:00'))
+        start_time = _parse_iso_datetime(arguments["start_time"])
+        end_time = _parse_iso_datetime(arguments["end_time"])
         elevation_threshold = arguments.get("elevation_threshold", 10.0)
         
-        access_windows = self.calculator.calculate_access_windows(
+        access_windows = await asyncio.to_thread(
+            self.calculator.calculate_access_windows,
             latitude=latitude,
             longitude=longitude,
             altitude=altitude,
@@ -329,7 +406,7 @@ class SatelliteMCPServer:
             "content": [
                 {
                     "type": "text",
-                    "text": json.dumps(access_windows, indent=2, cls=NumpyJSONEncoder)
+                    "text": _dumps_text(access_windows.to_dicts())
                 }
             ]
         }
@@ -338,27 +415,43 @@ class SatelliteMCPServer:
         """Calculate bulk access windows from CSV data."""
         locations_csv = arguments["locations_csv"]
         satellites_csv = arguments["satellites_csv"]
-        start_time = datetime.fromisoformat(arguments["start_time"].replace('Z', '+00:00'))
-        end_time = datetime.fromisoformat(arguments["end_time"].replace('Z', '+00:00'))
+        start_time = _parse_iso_datetime(arguments["start_time"])
+        end_time = _parse_iso_datetime(arguments["end_time"])
         elevation_threshold = arguments.get("elevation_threshold", 10.0)
         
-        bulk_results = self.calculator.calculate_bulk_access_windows(
-            locations_csv=locations_csv,
-            satellites_csv=satellites_csv,
-            start_time=start_time,
-            end_time=end_time,
-            elevation_threshold=elevation_threshold
+        # The calculation and the encoding of its (possibly large) result run in a worker thread
+        text = await asyncio.to_thread(
+            self._bulk_access_windows_text,
+            locations_csv, satellites_csv, start_time, end_time, elevation_threshold
         )
         
         return {
             "content": [
                 {
                     "type": "text",
-                    "text": json.dumps(bulk_results, indent=2, cls=NumpyJSONEncoder)
+                    "text": text
                 }
             ]
         }
     
+    def _bulk_access_windows_text(
+        self,
+        locations_csv: str,
+        satellites_csv: str,
+        start_time: datetime,
+        end_time: datetime,
+        elevation_threshold: float
+    ) -> str:
+        """Run a bulk access window calculation and return its JSON text."""
+        bulk_results = self.calculator.calculate_bulk_access_windows(
+            locations_csv=locations_csv,
+            satellites_csv=satellites_csv,
+            start_time=start_time,
+            end_time=end_time,
+            elevation_threshold=elevation_threshold
+        )
+        return _dumps_text(bulk_results)
+    
     async def _validate_tle(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Validate TLE data."""
         tle_line1 = arguments["tle_line1"]
@@ -370,7 +463,7 @@ class SatelliteMCPServer:
             "content": [
                 {
                     "type": "text",
-                    "text": json.dumps(asdict(validation_result), indent=2, cls=NumpyJSONEncoder)
+                    "text": _dumps_text(asdict(validation_result))
                 }
             ]
         }
@@ -391,7 +484,7 @@ class SatelliteMCPServer:
             "content": [
                 {
                     "type": "text",
-                    "text": json.dumps(response, indent=2, cls=NumpyJSONEncoder)
+                    "text": _dumps_text(response)
                 }
             ]
         }
@@ -403,8 +496,8 @@ class SatelliteMCPServer:
         altitude_ground = arguments.get("altitude_ground", 0)
         inclination = arguments["inclination"]
         altitude_km = arguments["altitude_km"]
-        start_time = datetime.fromisoformat(arguments["start_time"].replace('Z', '+00:00'))
-        end_time = datetime.fromisoformat(arguments["end_time"].replace('Z', '+00:00'))
+        start_time = _parse_iso_datetime(arguments["start_time"])
+        end_time = _parse_iso_datetime(arguments["end_time"])
         elevation_threshold = arguments.get("elevation_threshold", 10.0)
         eccentricity = arguments.get("eccentricity", 0.0001)
         raan = arguments.get("raan", 0.0)
@@ -422,7 +515,8 @@ class SatelliteMCPServer:
         if mean_anomaly != 0.0:
             orbital_text += f", mean anomaly {mean_anomaly} degrees"
         
-        access_windows = self.calculator.calculate_access_windows_from_orbital_elements(
+        access_windows = await asyncio.to_thread(
+            self.calculator.calculate_access_windows_from_orbital_elements,
             orbital_text=orbital_text,
             latitude=latitude,
             longitude=longitude,
@@ -435,7 +529,7 @@ class SatelliteMCPServer:
             "content": [
                 {
                     "type": "text",
-                    "text": json.dumps(access_windows, indent=2, cls=NumpyJSONEncoder)
+                    "text": _dumps_text(access_windows)
                 }
             ]
         }
@@ -445,8 +539,8 @@ class SatelliteMCPServer:
         city_name = arguments["city_name"]
         inclination = arguments["inclination"]
         altitude_km = arguments["altitude_km"]
-        start_time = datetime.fromisoformat(arguments["start_time"].replace('Z', '+00:00'))
-        end_time = datetime.fromisoformat(arguments["end_time"].replace('Z', '+00:00'))
+        start_time = _parse_iso_datetime(arguments["start_time"])
+        end_time = _parse_iso_datetime(arguments["end_time"])
         elevation_threshold = arguments.get("elevation_threshold", 10.0)
         eccentricity = arguments.get("eccentricity", 0.0001)
         raan = arguments.get("raan", 0.0)
@@ -464,7 +558,8 @@ class SatelliteMCPServer:
         if mean_anomaly != 0.0:
             orbital_text += f", mean anomaly {mean_anomaly} degrees"
         
-        city_results = self.calculator.calculate_access_windows_from_orbital_elements_by_city(
+        city_results = await asyncio.to_thread(
+            self.calculator.calculate_access_windows_from_orbital_elements_by_city,
             orbital_text=orbital_text,
             city_name=city_name,
             start_time=start_time,
@@ -476,7 +571,7 @@ class SatelliteMCPServer:
             "content": [
                 {
                     "type": "text",
-                    "text": json.dumps(city_results, indent=2, cls=NumpyJSONEncoder)
+                    "text": _dumps_text(city_results)
                 }
             ]
         }
@@ -484,8 +579,8 @@ class SatelliteMCPServer:
     async def _calculate_satellite_to_satellite_access_windows(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate access windows between satellites."""
         satellites = arguments["satellites"]
-        start_time = datetime.fromisoformat(arguments["start_time"].replace('Z', '+00:00'))
-        end_time = datetime.fromisoformat(arguments["end_time"].replace('Z', '+00:00'))
+        start_time = _parse_iso_datetime(arguments["start_time"])
+        end_time = _parse_iso_datetime(arguments["end_time"])
         min_separation_deg = arguments.get("min_separation_deg", 0.0)
         time_step_seconds = arguments.get("time_step_seconds", 30)
         
@@ -498,7 +593,8 @@ class SatelliteMCPServer:
                 'tle_line2': sat['tle_line2']
             })
         
-        results = self.calculator.calculate_satellite_to_satellite_access_windows(
+        results = await asyncio.to_thread(
+            self.calculator.calculate_satellite_to_satellite_access_windows,
             satellite_tles=satellite_tles,
             start_time=start_time,
             end_time=end_time,
@@ -510,7 +606,7 @@ class SatelliteMCPServer:
             "content": [
                 {
                     "type": "text",
-                    "text": json.dumps(results, indent=2, cls=NumpyJSONEncoder)
+                    "text": _dumps_text(results)
                 }
             ]
         }
@@ -518,26 +614,44 @@ class SatelliteMCPServer:
     async def _calculate_bulk_satellite_to_satellite_access_windows(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate bulk access windows between satellites from CSV."""
         satellites_csv = arguments["satellites_csv"]
-        start_time = datetime.fromisoformat(arguments["start_time"].replace('Z', '+00:00'))
-        end_time = datetime.fromisoformat(arguments["end_time"].replace('Z', '+00:00'))
+        start_time = _parse_iso_datetime(arguments["start_time"])
+        end_time = _parse_iso_datetime(arguments["end_time"])
         min_separation_deg = arguments.get("min_separation_deg", 0.0)
         time_step_seconds = arguments.get("time_step_seconds", 30)
         
+        # CSV parsing (which validates every TLE), the calculation and the
+        # encoding of its result all run in a worker thread
+        text = await asyncio.to_thread(
+            self._bulk_satellite_to_satellite_text,
+            satellites_csv, start_time, end_time, min_separation_deg, time_step_seconds
+        )
+        
+        return {
+            "content": [
+                {
+                    "type": "text",
+                    "text": text
+                }
+            ]
+        }
+    
+    def _bulk_satellite_to_satellite_text(
+        self,
+        satellites_csv: str,
+        start_time: datetime,
+        end_time: datetime,
+        min_separation_deg: float,
+        time_step_seconds: int
+    ) -> str:
+        """Run a bulk satellite-to-satellite calculation and return its JSON text."""
         # Parse satellites from CSV
         satellite_tles = self.calculator.parse_satellites_from_csv_content(satellites_csv)
         
         if len(satellite_tles) < 2:
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps({
-                            "error": "Need at least 2 satellites in CSV for inter-satellite calculations",
-                            "satellites_found": len(satellite_tles)
-                        }, indent=2)
-                    }
-                ]
-            }
+            return _dumps_text({
+                "error": "Need at least 2 satellites in CSV for inter-satellite calculations",
+                "satellites_found": len(satellite_tles)
+            })
         
         results = self.calculator.calculate_satellite_to_satellite_access_windows(
             satellite_tles=satellite_tles,
@@ -546,20 +660,42 @@ class SatelliteMCPServer:
             min_separation_deg=min_separation_deg,
             time_step_seconds=time_step_seconds
         )
+        return _dumps_text(results)
+    
+    async def _respond(self, line: str) -> None:
+        """Handle one request line and write its response."""
+        request = None
+        try:
+            request = _loads(line)
+            response = await self.handle_request(request)
+            _write_message(response)
+            
+        except json.JSONDecodeError as e:
+            error_response = {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {"code": -32700, "message": "Parse error", "data": str(e)}
+            }
+            _write_message(error_response)
         
-        return {
-            "content": [
-                {
-                    "type": "text",
-                    "text": json.dumps(results, indent=2, cls=NumpyJSONEncoder)
-                }
-            ]
-        }
+        except Exception as e:
+            # Anything else (e.g. a message that is not an object) still gets an
+            # answer, rather than leaving the error unretrieved on this task
+            logger.error(f"Error: {str(e)}")
+            error_response = {
+                "jsonrpc": "2.0",
+                "id": request.get("id") if isinstance(request, dict) else None,
+                "error": {"code": -32603, "message": "Internal error", "data": str(e)}
+            }
+            _write_message(error_response)
     
     async def run(self):
         """Run the server."""
         logger.info("Starting Satellite MCP Server")
         
+        # Requests are served as tasks, so a long calculation (run in a worker
+        # thread) does not hold up the requests that follow it
+        pending = set()
         try:
             while True:
                 line = await asyncio.get_event_loop().run_in_executor(
@@ -573,18 +709,12 @@ class SatelliteMCPServer:
                 if not line:
                     continue
                 
-                try:
-                    request = json.loads(line)
-                    response = await self.handle_request(request)
-                    print(json.dumps(response, cls=NumpyJSONEncoder), flush=True)
-                    
-                except json.JSONDecodeError as e:
-                    error_response = {
-                        "jsonrpc": "2.0",
-                        "id": None,
-                        "error": {"code": -32700, "message": "Parse error", "data": str(e)}
-                    }
-                    print(json.dumps(error_response, cls=NumpyJSONEncoder), flush=True)
+                task = asyncio.create_task(self._respond(line))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            
+            if pending:
+                await asyncio.gather(*pending)
                 
         except KeyboardInterrupt:
             logger.info("Server stopped")
@@ -595,8 +725,14 @@ class SatelliteMCPServer:
 async def main():
     """Main entry point."""
     server = SatelliteMCPServer()
-    await server.run()
+    try:
+        await server.run()
+    finally:
+        server.calculator.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
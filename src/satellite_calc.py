@@ -1,14 +1,28 @@
 """Core satellite orbital mechanics calculations using Skyfield library."""
 
+import bisect
+import collections
+import functools
 import logging
 import math
+import multiprocessing
+import os
 import re
+import struct
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, asdict, replace
+from types import MappingProxyType
 
 import numpy as np
+from sgp4.api import SatrecArray
 from skyfield.api import Topos, load, EarthSatellite, wgs84
+from skyfield.constants import ANGVEL, ERAD
+from skyfield.sgp4lib import theta_GMST1982
 from skyfield.timelib import Time
 from skyfield.units import Angle
 from skyfield.almanac import find_discrete, risings_and_settings
@@ -20,19 +34,31 @@ from .world_cities import lookup_city, search_cities
 logger = logging.getLogger(__name__)
 
 
+# Byte -> checksum value: digits count as their value, '-' as 1, anything else 0
+_TLE_CHECKSUM_TABLE = bytes(
+    byte - ord('0') if ord('0') <= byte <= ord('9') else 1 if byte == ord('-') else 0
+    for byte in range(256)
+)
+
+
+def _tle_checksum_bytes(line: bytes) -> int:
+    """Calculate TLE checksum of an ASCII line, excluding its last byte."""
+    return sum(line[:-1].translate(_TLE_CHECKSUM_TABLE)) % 10
+
+
 def calculate_tle_checksum(line: str) -> int:
-    """Calculate TLE checksum."""
-    checksum = 0
-    for char in line[:-1]:  # Exclude the checksum digit itself
-        if char.isdigit():
-            checksum += int(char)
-        elif char == '-':
-            checksum += 1
-    return checksum % 10
+    """Calculate TLE checksum (modulo-10 sum of digits, '-' counting as 1)."""
+    # Exclude the checksum digit itself
+    return _tle_checksum_bytes(line.encode('ascii', 'replace'))
+
+
+# TLE line templates for generated elements; the trailing 0 is replaced by the checksum
+_TLE_LINE1_TEMPLATE = b"1 %05dU 24001A   %02d%012.8f  .00001000  00000-0  10000-4 0  9990"
+_TLE_LINE2_TEMPLATE = b"2 %05d %8.4f %8.4f %07d %8.4f %8.4f %11.8f%5d0"
 
 
 # Orbital type definitions with standard parameters
-ORBIT_TYPES = {
+_ORBIT_TYPE_DEFINITIONS = {
     "LEO": {
         "description": "Low Earth Orbit",
         "typical_altitude_km": 400,
@@ -83,47 +109,185 @@ ORBIT_TYPES = {
     }
 }
 
+# Read-only view of the definitions, shared by every caller
+ORBIT_TYPES = MappingProxyType({
+    name: MappingProxyType(definition) for name, definition in _ORBIT_TYPE_DEFINITIONS.items()
+})
+
+# Structure-of-arrays view of the ORBIT_TYPES ranges for vectorized
+# classification, ordered from the narrowest altitude x inclination range
+# to the widest so the first match is the most specific orbit type.
+_ORBIT_CLASSIFY_ORDER = sorted(
+    ORBIT_TYPES,
+    key=lambda name: (
+        (ORBIT_TYPES[name]["altitude_range"][1] - ORBIT_TYPES[name]["altitude_range"][0])
+        * (ORBIT_TYPES[name]["inclination_range"][1] - ORBIT_TYPES[name]["inclination_range"][0])
+    )
+)
+_OT_NAMES = np.array(_ORBIT_CLASSIFY_ORDER, dtype=object)
+_OT_ALT_LO = np.array([ORBIT_TYPES[name]["altitude_range"][0] for name in _ORBIT_CLASSIFY_ORDER], dtype=float)
+_OT_ALT_HI = np.array([ORBIT_TYPES[name]["altitude_range"][1] for name in _ORBIT_CLASSIFY_ORDER], dtype=float)
+_OT_INC_LO = np.array([ORBIT_TYPES[name]["inclination_range"][0] for name in _ORBIT_CLASSIFY_ORDER], dtype=float)
+_OT_INC_HI = np.array([ORBIT_TYPES[name]["inclination_range"][1] for name in _ORBIT_CLASSIFY_ORDER], dtype=float)
+_OT_ECC = np.array([ORBIT_TYPES[name]["eccentricity"] for name in _ORBIT_CLASSIFY_ORDER], dtype=float)
+
+# Sun elevation thresholds (degrees) separating the ground lighting conditions:
+# astronomical, nautical and civil twilight, and the horizon accounting for
+# atmospheric refraction. A condition applies when the sun is strictly above
+# the lower threshold, so searchsorted uses its default side='left'.
+SUN_ELEVATION_THRESHOLDS = np.array([-18.0, -12.0, -6.0, -0.833])
+LIGHTING_CONDITIONS = ("night", "astronomical_twilight", "nautical_twilight", "civil_twilight", "daylight")
+
+# Default inclination by orbit type, as a function of (generator, altitude_km).
+# Types not listed fall back to the midpoint of their inclination range.
+_DEFAULT_INCLINATION = {
+    'GEO': lambda generator, altitude_km: 0.0,
+    'SSO': lambda generator, altitude_km: generator.calculate_sso_inclination(altitude_km),
+    'POLAR': lambda generator, altitude_km: 90.0,
+    'MOLNIYA': lambda generator, altitude_km: 63.4,
+}
+
+
+# Text parsing patterns, in priority order within each category. Patterns
+# expect lowercased text; each numeric capture is named after its pattern.
+_ALTITUDE_PATTERNS = [
+    r'(?P<altitude_0>\d+(?:\.\d+)?)\s*km(?:\s+altitude)?',
+    r'altitude\s+(?:of\s+)?(?P<altitude_1>\d+(?:\.\d+)?)\s*km',
+    r'at\s+(?P<altitude_2>\d+(?:\.\d+)?)\s*km',
+    r'(?P<altitude_3>\d+(?:\.\d+)?)\s*kilometers?(?:\s+altitude)?'
+]
+
+_INCLINATION_PATTERNS = [
+    r'inclination\s+(?:of\s+)?(?P<inclination_0>\d+(?:\.\d+)?)\s*(?:degrees?|°)',
+    r'(?P<inclination_1>\d+(?:\.\d+)?)\s*(?:degrees?|°)\s+inclination',
+    r'inclined\s+at\s+(?P<inclination_2>\d+(?:\.\d+)?)\s*(?:degrees?|°)'
+]
+
+_ORBIT_TYPE_PATTERNS = {
+    'LEO': [r'low\s+earth\s+orbit', r'\bleo\b'],
+    'MEO': [r'medium\s+earth\s+orbit', r'\bmeo\b'],
+    'GEO': [r'geostationary', r'\bgeo\b', r'geosynchronous'],
+    'SSO': [r'sun[\s-]synchronous', r'\bsso\b'],
+    'MOLNIYA': [r'molniya', r'highly\s+elliptical'],
+    'POLAR': [r'polar\s+orbit', r'\bpolar\b']
+}
+
+_ALTITUDE_GROUPS = [f'altitude_{i}' for i in range(len(_ALTITUDE_PATTERNS))]
+_INCLINATION_GROUPS = [f'inclination_{i}' for i in range(len(_INCLINATION_PATTERNS))]
+_ORBIT_TYPE_GROUPS = {
+    orbit_type: [f'orbit_{orbit_type}_{i}' for i in range(len(patterns))]
+    for orbit_type, patterns in _ORBIT_TYPE_PATTERNS.items()
+}
+
+# All patterns fused into one alternation inside a lookahead, so a single
+# finditer pass reports every position where some pattern matches without
+# consuming text. Patterns for different fields or orbit types never match
+# at the same position, so the alternation order cannot hide a hit.
+_COMBINED_PATTERN = re.compile('(?=' + '|'.join(
+    _ALTITUDE_PATTERNS
+    + _INCLINATION_PATTERNS
+    + [f'(?P<{group}>{pattern})'
+       for orbit_type, patterns in _ORBIT_TYPE_PATTERNS.items()
+       for group, pattern in zip(_ORBIT_TYPE_GROUPS[orbit_type], patterns)]
+) + ')')
+
+# Same without the orbit type patterns, used when the text contains none of
+# the orbit type literals below (every orbit type pattern contains one)
+_NUMERIC_PATTERN = re.compile('(?=' + '|'.join(_ALTITUDE_PATTERNS + _INCLINATION_PATTERNS) + ')')
+_ORBIT_TYPE_LITERALS = ('earth', 'leo', 'meo', 'geo', 'synchronous', 'sso', 'molniya', 'elliptical', 'polar')
+
 
 class OrbitalElementsParser:
     """Parse natural language text to extract orbital parameters."""
     
     def __init__(self):
-        """Initialize the parser with regex patterns."""
-        # Altitude patterns
-        self.altitude_patterns = [
-            r'(\d+(?:\.\d+)?)\s*km(?:\s+altitude)?',
-            r'altitude\s+(?:of\s+)?(\d+(?:\.\d+)?)\s*km',
-            r'at\s+(\d+(?:\.\d+)?)\s*km',
-            r'(\d+(?:\.\d+)?)\s*kilometers?(?:\s+altitude)?'
-        ]
+        """Initialize the parser."""
+        # Location keywords for reference ("passing over" is covered by "over")
+        self.location_keywords = ('over', 'above')
+    
+    @staticmethod
+    def classify(altitude_km, inclination_deg):
+        """Infer orbit type(s) from altitude and inclination.
         
-        # Inclination patterns
-        self.inclination_patterns = [
-            r'inclination\s+(?:of\s+)?(\d+(?:\.\d+)?)\s*(?:degrees?|°)',
-            r'(\d+(?:\.\d+)?)\s*(?:degrees?|°)\s+inclination',
-            r'inclined\s+at\s+(\d+(?:\.\d+)?)\s*(?:degrees?|°)'
-        ]
+        Accepts scalars or arrays. The narrowest matching ORBIT_TYPES range
+        wins; returns None where no orbit type matches.
+        """
+        alt = np.asarray(altitude_km, dtype=float)[..., np.newaxis]
+        inc = np.asarray(inclination_deg, dtype=float)[..., np.newaxis]
+        mask = (alt >= _OT_ALT_LO) & (alt <= _OT_ALT_HI) & (inc >= _OT_INC_LO) & (inc <= _OT_INC_HI)
+        names = np.where(mask.any(axis=-1), _OT_NAMES[np.argmax(mask, axis=-1)], None)
+        return names.item() if names.ndim == 0 else names
+    
+    def _extract_location(self, text: str) -> Optional[str]:
+        """Return the run of letters, spaces and commas after a location keyword."""
+        n = len(text)
+        for keyword in self.location_keywords:
+            idx = text.find(keyword)
+            while idx != -1:
+                start = idx + len(keyword)
+                while start < n and text[start].isspace():
+                    start += 1
+                # Keyword must be followed by whitespace and then a letter
+                if start > idx + len(keyword) and start < n and 'a' <= text[start] <= 'z':
+                    # Scan letters, commas and whitespace; the result ends at the last letter
+                    end = pos = start
+                    while pos < n:
+                        char = text[pos]
+                        if 'a' <= char <= 'z':
+                            end = pos + 1
+                        elif char != ',' and not char.isspace():
+                            break
+                        pos += 1
+                    return text[start:end]
+                idx = text.find(keyword, idx + 1)
+        return None
+    
+    def parse_text(self, text: str, verbose: bool = False) -> Dict[str, Any]:
+        """Parse natural language text to extract orbital parameters.
         
-        # Orbit type patterns
-        self.orbit_type_patterns = {
-            'LEO': [r'low\s+earth\s+orbit', r'\bLEO\b'],
-            'MEO': [r'medium\s+earth\s+orbit', r'\bMEO\b'],
-            'GEO': [r'geostationary', r'\bGEO\b', r'geosynchronous'],
-            'SSO': [r'sun[\s-]synchronous', r'\bSSO\b'],
-            'MOLNIYA': [r'molniya', r'highly\s+elliptical'],
-            'POLAR': [r'polar\s+orbit', r'\bpolar\b']
-        }
+        The human-readable 'parsed_elements' summary is only filled in when
+        verbose is True.
+        """
+        # Patterns are written in lowercase, so no re.IGNORECASE is needed
+        text = text.lower().strip()
         
-        # Location patterns for reference
-        self.location_patterns = [
-            r'over\s+([a-zA-Z\s,]+)',
-            r'above\s+([a-zA-Z\s,]+)',
-            r'passing\s+over\s+([a-zA-Z\s,]+)'
-        ]
+        # First (leftmost) hit of each pattern, from one pass over the text
+        hits = {}
+        for match in self._scan_pattern(text).finditer(text):
+            hits.setdefault(match.lastgroup, match)
+        
+        return self._build_result(text, hits, verbose)
     
-    def parse_text(self, text: str) -> Dict[str, Any]:
-        """Parse natural language text to extract orbital parameters."""
-        text = text.lower().strip()
+    def parse_batch(self, texts: List[str], verbose: bool = False) -> List[Dict[str, Any]]:
+        """Parse many texts with a single regex pass over all of them.
+        
+        Returns one parse_text result per input text, in order.
+        """
+        lowered = [text.lower().strip() for text in texts]
+        
+        # No pattern can match across a NUL, so the texts are scanned joined
+        # together and each hit is mapped back to its text by offset
+        joined = '\x00'.join(lowered)
+        offsets = []
+        position = 0
+        for text in lowered:
+            offsets.append(position)
+            position += len(text) + 1
+        
+        hits = [{} for _ in lowered]
+        for match in self._scan_pattern(joined).finditer(joined):
+            hits[bisect.bisect_right(offsets, match.start()) - 1].setdefault(match.lastgroup, match)
+        
+        return [self._build_result(text, text_hits, verbose) for text, text_hits in zip(lowered, hits)]
+    
+    def _scan_pattern(self, text: str) -> re.Pattern:
+        """Pick the fused pattern; orbit types are skipped when no orbit literal appears."""
+        if any(literal in text for literal in _ORBIT_TYPE_LITERALS):
+            return _COMBINED_PATTERN
+        return _NUMERIC_PATTERN
+    
+    def _build_result(self, text: str, hits: Dict[str, re.Match], verbose: bool) -> Dict[str, Any]:
+        """Build a parse result from the first hit of each pattern group."""
         result = {
             'altitude_km': None,
             'inclination_deg': None,
@@ -134,50 +298,57 @@ class OrbitalElementsParser:
         }
         
         # Extract altitude
-        for pattern in self.altitude_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for group in _ALTITUDE_GROUPS:
+            match = hits.get(group)
             if match:
-                result['altitude_km'] = float(match.group(1))
-                result['parsed_elements'].append(f"altitude: {result['altitude_km']} km")
+                result['altitude_km'] = float(match.group(group))
+                if verbose:
+                    result['parsed_elements'].append(f"altitude: {result['altitude_km']} km")
                 break
         
         # Extract inclination
-        for pattern in self.inclination_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for group in _INCLINATION_GROUPS:
+            match = hits.get(group)
             if match:
-                result['inclination_deg'] = float(match.group(1))
-                result['parsed_elements'].append(f"inclination: {result['inclination_deg']}°")
+                result['inclination_deg'] = float(match.group(group))
+                if verbose:
+                    result['parsed_elements'].append(f"inclination: {result['inclination_deg']}°")
                 break
         
         # Extract orbit type
-        for orbit_type, patterns in self.orbit_type_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    result['orbit_type'] = orbit_type
+        for orbit_type, groups in _ORBIT_TYPE_GROUPS.items():
+            if any(group in hits for group in groups):
+                result['orbit_type'] = orbit_type
+                if verbose:
                     result['parsed_elements'].append(f"orbit type: {orbit_type}")
-                    break
-            if result['orbit_type']:
                 break
         
         # Extract reference location
-        for pattern in self.location_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                result['reference_location'] = match.group(1).strip()
-                result['parsed_elements'].append(f"reference location: {result['reference_location']}")
-                break
+        reference_location = self._extract_location(text)
+        if reference_location:
+            result['reference_location'] = reference_location
+            if verbose:
+                result['parsed_elements'].append(f"reference location: {reference_location}")
         
         return result
 
-
 class TLEGenerator:
     """Generate TLE data from orbital elements."""
     
+    # rad/s -> revolutions per day
+    _N_SCALE = 86400.0 / (2.0 * math.pi)
+    # Reciprocal of the reference semi-major axis (km) in the SSO approximation
+    _SSO_INV_A = 1.0 / 12352
+    
     def __init__(self):
         """Initialize TLE generator."""
         self.earth_radius_km = 6371.0
         self.earth_mu = 398600.4418  # km³/s²
         self.parser = OrbitalElementsParser()
+        # Per-instance cache of (parsed parameters, orbital elements) keyed on the text
+        self._cached_elements = functools.lru_cache(maxsize=512)(self._parse_elements)
+        # TLE lines keyed on (text, epoch); epochs are whole minutes, so repeats within a minute hit
+        self._cached_tle = functools.lru_cache(maxsize=512)(self._generate_tle)
     
     def altitude_to_semi_major_axis(self, altitude_km: float) -> float:
         """Convert altitude to semi-major axis."""
@@ -186,9 +357,8 @@ class TLEGenerator:
     def semi_major_axis_to_mean_motion(self, semi_major_axis_km: float) -> float:
         """Calculate mean motion (revolutions per day) from semi-major axis."""
         # Kepler's third law: n = sqrt(μ/a³)
-        n_rad_per_sec = math.sqrt(self.earth_mu / (semi_major_axis_km ** 3))
-        n_rev_per_day = n_rad_per_sec * 86400 / (2 * math.pi)
-        return n_rev_per_day
+        a = semi_major_axis_km
+        return math.sqrt(self.earth_mu / (a * a * a)) * self._N_SCALE
     
     def calculate_sso_inclination(self, altitude_km: float) -> float:
         """Calculate inclination for sun-synchronous orbit at given altitude."""
@@ -196,7 +366,8 @@ class TLEGenerator:
         # Real calculation involves J2 perturbation, this is an approximation
         a = self.altitude_to_semi_major_axis(altitude_km)
         # Approximate formula for SSO inclination
-        inclination_rad = math.acos(-((a / 12352) ** 3.5))
+        x = a * self._SSO_INV_A
+        inclination_rad = math.acos(-(x * x * x * math.sqrt(x)))  # x ** 3.5
         return math.degrees(inclination_rad)
     
     def generate_orbital_elements(self, parsed_params: Dict[str, Any]) -> Dict[str, Any]:
@@ -227,14 +398,9 @@ class TLEGenerator:
                 elements['altitude_km'] = orbit_def.get('typical_altitude_km', 400)
             
             if not parsed_params.get('inclination_deg'):
-                if parsed_params['orbit_type'] == 'GEO':
-                    elements['inclination_deg'] = 0.0
-                elif parsed_params['orbit_type'] == 'SSO':
-                    elements['inclination_deg'] = self.calculate_sso_inclination(elements['altitude_km'])
-                elif parsed_params['orbit_type'] == 'POLAR':
-                    elements['inclination_deg'] = 90.0
-                elif parsed_params['orbit_type'] == 'MOLNIYA':
-                    elements['inclination_deg'] = 63.4
+                default_inclination = _DEFAULT_INCLINATION.get(parsed_params['orbit_type'])
+                if default_inclination is not None:
+                    elements['inclination_deg'] = default_inclination(self, elements['altitude_km'])
                 else:
                     # Use range midpoint for other types
                     inc_range = orbit_def.get('inclination_range', (51, 52))
@@ -250,52 +416,79 @@ class TLEGenerator:
         
         return elements
     
-    def generate_tle_from_elements(self, elements: Dict[str, Any], satellite_number: int = None) -> Tuple[str, str]:
-        """Generate TLE lines from orbital elements."""
-        # Use dummy satellite number in range 90000-99999 if not provided
+    def generate_tle_from_elements(
+        self,
+        elements: Dict[str, Any],
+        satellite_number: int = None,
+        epoch: Optional[datetime] = None
+    ) -> Tuple[str, str]:
+        """Generate TLE lines from orbital elements, at ``epoch`` (UTC, default now)."""
+        # Use dummy satellite number in range 90000-99999 if not provided,
+        # derived deterministically from the orbital elements
         if satellite_number is None:
-            satellite_number = 90000 + hash(str(elements)) % 10000
+            packed = struct.pack(
+                "6d",
+                elements['altitude_km'],
+                elements['inclination_deg'],
+                elements['eccentricity'],
+                elements['argument_of_perigee_deg'],
+                elements['raan_deg'],
+                elements['mean_anomaly_deg']
+            )
+            satellite_number = 90000 + zlib.adler32(packed) % 10000
         
-        # Current epoch
-        now = datetime.now(timezone.utc)
+        # Epoch, defaulting to the current time
+        now = epoch or datetime.now(timezone.utc)
         epoch_year = now.year % 100  # Two-digit year
         day_of_year = now.timetuple().tm_yday
         fraction_of_day = (now.hour * 3600 + now.minute * 60 + now.second) / 86400.0
         epoch_day = day_of_year + fraction_of_day
         
-        # Format TLE Line 1 (without checksum)
-        line1_base = f"1 {satellite_number:05d}U 24001A   {epoch_year:02d}{epoch_day:012.8f}  .00001000  00000-0  10000-4 0  999"
+        # Format TLE Line 1
+        line1 = bytearray(_TLE_LINE1_TEMPLATE % (satellite_number, epoch_year, epoch_day))
         
-        # Format TLE Line 2 (without checksum)
+        # Format TLE Line 2
         inclination = elements['inclination_deg']
         raan = elements['raan_deg']
-        eccentricity_str = f"{int(elements['eccentricity'] * 10000000):07d}"
+        eccentricity = int(elements['eccentricity'] * 10000000)
         arg_perigee = elements['argument_of_perigee_deg']
         mean_anomaly = elements['mean_anomaly_deg']
         mean_motion = elements['mean_motion_rev_per_day']
         rev_number = 1  # Dummy revolution number
         
-        line2_base = f"2 {satellite_number:05d} {inclination:8.4f} {raan:8.4f} {eccentricity_str} {arg_perigee:8.4f} {mean_anomaly:8.4f} {mean_motion:11.8f}{rev_number:5d}"
-        
-        # Calculate and append checksums
-        checksum1 = calculate_tle_checksum(line1_base + "0")
-        checksum2 = calculate_tle_checksum(line2_base + "0")
+        line2 = bytearray(_TLE_LINE2_TEMPLATE % (
+            satellite_number, inclination, raan, eccentricity, arg_perigee, mean_anomaly, mean_motion, rev_number
+        ))
         
-        line1_final = line1_base + str(checksum1)
-        line2_final = line2_base + str(checksum2)
+        # Write checksums into the last byte
+        line1[-1] = ord('0') + _tle_checksum_bytes(line1)
+        line2[-1] = ord('0') + _tle_checksum_bytes(line2)
         
-        return line1_final, line2_final
+        return line1.decode('ascii'), line2.decode('ascii')
+    
+    def _parse_elements(self, text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Parse text and derive its orbital elements."""
+        parsed_params = self.parser.parse_text(text, verbose=True)
+        return parsed_params, self.generate_orbital_elements(parsed_params)
+    
+    def _generate_tle(self, text: str, epoch: datetime) -> Tuple[str, str]:
+        """Generate the TLE lines for a text's orbital elements at an epoch."""
+        return self.generate_tle_from_elements(self._cached_elements(text)[1], epoch=epoch)
     
     def parse_and_generate_tle(self, text: str) -> Dict[str, Any]:
-        """Parse natural language text and generate TLE."""
-        # Parse the text
-        parsed_params = self.parser.parse_text(text)
+        """Parse natural language text and generate TLE.
         
-        # Generate orbital elements
-        elements = self.generate_orbital_elements(parsed_params)
+        Parsing is cached per text and the TLE per text and minute; its
+        epoch is the start of the current minute.
+        """
+        # Parse the text and generate orbital elements (copied, as the cache owns them)
+        parsed_params, elements = self._cached_elements(text)
+        parsed_params = dict(parsed_params, parsed_elements=list(parsed_params['parsed_elements']))
+        elements = dict(elements)
         
         # Generate TLE
-        line1, line2 = self.generate_tle_from_elements(elements)
+        epoch = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+        line1, line2 = self._cached_tle(text, epoch)
         
         return {
             'parsed_text': text,
@@ -315,7 +508,85 @@ class TLEGenerator:
         }
 
 
-@dataclass
+def _find_access_events(values: np.ndarray, threshold: float) -> np.ndarray:
+    """Find runs of samples at or above a threshold.
+    
+    Args:
+        values: Sampled quantity (e.g. sin of elevation)
+        threshold: Minimum value for a sample to be in access
+        
+    Returns:
+        (N, 3) integer array of (aos, los, culmination) sample indices, one
+        row per run; culmination is the first maximum within the run
+    """
+    # Rising/falling edges of the above-threshold mask; padding with False
+    # closes runs that are already open at the start or still open at the end
+    above = np.concatenate(([False], values >= threshold, [False]))
+    edges = np.flatnonzero(above[1:] != above[:-1])
+    
+    aos_idx = edges[0::2]
+    los_idx = edges[1::2] - 1
+    culmination_idx = [start + np.argmax(values[start:end + 1]) for start, end in zip(aos_idx, los_idx)]
+    return np.column_stack((aos_idx, los_idx, np.array(culmination_idx, dtype=aos_idx.dtype)))
+
+
+# Spacing of the screening samples used by calculate_access_windows' adaptive mode
+COARSE_SEARCH_STEP_SECONDS = 300
+
+
+def _interpolate_crossings(values: np.ndarray, events: np.ndarray, threshold: float) -> np.ndarray:
+    """Refine AOS/LOS sample indices to fractional threshold-crossing positions.
+    
+    Args:
+        values: Sampled quantity passed to _find_access_events
+        events: (N, 3) array of (aos, los, culmination) sample indices
+        threshold: Threshold the runs were found against
+        
+    Returns:
+        (N, 3) float array of sample positions; AOS and LOS are linearly
+        interpolated between the bracketing samples, while runs open at
+        either end of the grid and culminations keep their sample index
+    """
+    positions = events.astype(float)
+    
+    # AOS crossing lies between the sample before the run and its first sample
+    rising = events[:, 0] > 0
+    before = events[rising, 0] - 1
+    positions[rising, 0] = before + (threshold - values[before]) / (values[before + 1] - values[before])
+    
+    # LOS crossing lies between the run's last sample and the one after it
+    setting = events[:, 1] < len(values) - 1
+    last = events[setting, 1]
+    positions[setting, 1] = last + (values[last] - threshold) / (values[last] - values[last + 1])
+    
+    return positions
+
+
+def _in_earth_shadow(satellite_km: np.ndarray, sun_km: np.ndarray) -> np.ndarray:
+    """Cylindrical Earth shadow test.
+    
+    Takes geocentric satellite and sun positions in km, shape (3,) or (3, N),
+    and returns whether each satellite is behind the Earth inside the
+    Earth-radius cylinder along the anti-sun direction.
+    """
+    sun_hat = sun_km / np.linalg.norm(sun_km, axis=0)
+    along = np.einsum('k...,k...->...', satellite_km, sun_hat)
+    perpendicular_sq = np.einsum('k...,k...->...', satellite_km, satellite_km) - along ** 2
+    return (along < 0) & (perpendicular_sq < (ERAD / 1000.0) ** 2)
+
+
+def _isoformat_utc(times: np.ndarray) -> List[str]:
+    """Format UTC datetime64[us] values as datetime.isoformat() does for aware UTC datetimes.
+    
+    Microseconds are omitted when they are zero, as isoformat() does.
+    """
+    text = np.datetime_as_string(times, unit='us')
+    whole_seconds = times == times.astype('datetime64[s]')
+    text[whole_seconds] = np.datetime_as_string(times[whole_seconds], unit='s')
+    return [value + '+00:00' for value in text.tolist()]
+
+
+@dataclass(slots=True)
 class AccessWindow:
     """Represents a satellite access window over a ground station."""
     aos_time: datetime
@@ -331,9 +602,92 @@ class AccessWindow:
     satellite_lighting: Dict[str, Any]  # Sunlight/eclipse conditions for satellite
 
 
+@dataclass(eq=False)
+class AccessWindowArray:
+    """Access windows stored column-wise, one array per AccessWindow field.
+    
+    Times are UTC datetime64[us] arrays. Indexing and iteration give
+    AccessWindow objects, so it can be used like a list of windows.
+    """
+    aos_time: np.ndarray
+    los_time: np.ndarray
+    culmination_time: np.ndarray
+    duration_seconds: np.ndarray
+    max_elevation_deg: np.ndarray
+    aos_azimuth_deg: np.ndarray
+    los_azimuth_deg: np.ndarray
+    culmination_azimuth_deg: np.ndarray
+    ground_lighting: List[Dict[str, Any]]
+    satellite_lighting: List[Dict[str, Any]]
+    
+    @classmethod
+    def empty(cls) -> 'AccessWindowArray':
+        """Return an array holding no windows."""
+        no_times = np.array([], dtype='datetime64[us]')
+        no_values = np.array([], dtype=float)
+        return cls(no_times, no_times, no_times, no_values, no_values, no_values, no_values, no_values, [], [])
+    
+    def __len__(self) -> int:
+        return len(self.duration_seconds)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return AccessWindow(
+            aos_time=self.aos_time[index].item().replace(tzinfo=timezone.utc),
+            los_time=self.los_time[index].item().replace(tzinfo=timezone.utc),
+            culmination_time=self.culmination_time[index].item().replace(tzinfo=timezone.utc),
+            duration_seconds=self.duration_seconds[index].item(),
+            max_elevation_deg=self.max_elevation_deg[index].item(),
+            aos_azimuth_deg=self.aos_azimuth_deg[index].item(),
+            los_azimuth_deg=self.los_azimuth_deg[index].item(),
+            culmination_azimuth_deg=self.culmination_azimuth_deg[index].item(),
+            ground_lighting=self.ground_lighting[index],
+            satellite_lighting=self.satellite_lighting[index]
+        )
+    
+    def __iter__(self) -> Iterator[AccessWindow]:
+        return (self[i] for i in range(len(self)))
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Format the windows as JSON-ready dicts, reading the columns directly.
+        
+        Times are ISO 8601 strings; angles and minutes are rounded to 2 decimals.
+        """
+        # Numeric fields are rounded column-wise in one call each
+        duration_minutes = np.round(self.duration_seconds / 60.0, 2).tolist()
+        angles = np.round(np.column_stack((
+            self.max_elevation_deg, self.aos_azimuth_deg, self.los_azimuth_deg, self.culmination_azimuth_deg
+        )), 2).tolist()
+        
+        return [
+            {
+                "aos_time": aos_time,
+                "los_time": los_time,
+                "culmination_time": culmination_time,
+                "duration_seconds": duration_seconds,
+                "duration_minutes": minutes,
+                "max_elevation_deg": max_elevation_deg,
+                "aos_azimuth_deg": aos_azimuth_deg,
+                "los_azimuth_deg": los_azimuth_deg,
+                "culmination_azimuth_deg": culmination_azimuth_deg,
+                "ground_lighting": ground_lighting,
+                "satellite_lighting": satellite_lighting
+            }
+            for aos_time, los_time, culmination_time, duration_seconds, minutes,
+                (max_elevation_deg, aos_azimuth_deg, los_azimuth_deg, culmination_azimuth_deg),
+                ground_lighting, satellite_lighting
+            in zip(
+                _isoformat_utc(self.aos_time),
+                _isoformat_utc(self.los_time),
+                _isoformat_utc(self.culmination_time),
+                self.duration_seconds.tolist(), duration_minutes, angles,
+                self.ground_lighting, self.satellite_lighting
+            )
+        ]
 
 
-@dataclass
+@dataclass(slots=True)
 class TLEValidationResult:
     """Result of TLE validation."""
     is_valid: bool
@@ -357,10 +711,71 @@ class SatelliteCalculator:
         self.eph = load('de421.bsp')  # Load planetary ephemeris
         self.sun = self.eph['sun']
         self.earth = self.eph['earth']
+        # Geometric Earth -> Sun vector, for the satellite shadow test
+        self._earth_to_sun = self.sun - self.earth
         self.tle_generator = TLEGenerator()
+        # Per-instance cache of EarthSatellite objects keyed on (line1, line2)
+        self._load_satellite = functools.lru_cache(maxsize=256)(self._create_satellite)
+        # Per-instance cache of Earth + ground location vector sums keyed on (lat, lon)
+        self._observer = functools.lru_cache(maxsize=1024)(self._create_observer)
+        # Per-instance cache of TLE validation results keyed on (line1, line2)
+        self._cached_validation = functools.lru_cache(maxsize=4096)(self._check_tle)
+        # Per-instance cache of ground station ITRS position and horizon basis keyed on (lat, lon, alt)
+        self._station_frame = functools.lru_cache(maxsize=1024)(self._create_station_frame)
+        # Process pool for large bulk calculations, created on first use and reused
+        self._bulk_pool = None
+        self._bulk_pool_lock = threading.Lock()
+    
+    def _bulk_executor(self) -> ProcessPoolExecutor:
+        """Return the bulk worker pool, starting it on first use.
+        
+        Workers are started with forkserver (spawn where unavailable), never
+        fork: the server calls in here from worker threads, and a forked child
+        can inherit locks held by other threads.
+        """
+        with self._bulk_pool_lock:
+            if self._bulk_pool is None:
+                method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                self._bulk_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count() or 1,
+                    mp_context=multiprocessing.get_context(method),
+                    initializer=_init_bulk_worker
+                )
+            return self._bulk_pool
+    
+    def close(self) -> None:
+        """Shut down the bulk worker pool, if one was started."""
+        with self._bulk_pool_lock:
+            pool, self._bulk_pool = self._bulk_pool, None
+        if pool is not None:
+            pool.shutdown()
+    
+    def _create_satellite(self, line1: str, line2: str) -> EarthSatellite:
+        """Create an EarthSatellite on this calculator's timescale."""
+        return EarthSatellite(line1, line2, ts=self.ts)
+    
+    def _create_observer(self, latitude: float, longitude: float):
+        """Create the Earth-centred vector sum for a ground location."""
+        return self.earth + wgs84.latlon(latitude, longitude)
+    
+    def _create_station_frame(self, latitude: float, longitude: float, altitude: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Return a ground station's ITRS position (km) and horizon basis (read-only arrays)."""
+        station_km = Topos(latitude_degrees=latitude, longitude_degrees=longitude, elevation_m=altitude).itrs_xyz.km
+        basis = self._horizon_basis(latitude, longitude)
+        station_km.flags.writeable = False
+        basis.flags.writeable = False
+        return station_km, basis
     
     def validate_tle(self, line1: str, line2: str) -> TLEValidationResult:
-        """Validate Two-Line Element data and extract orbital parameters."""
+        """Validate Two-Line Element data and extract orbital parameters.
+        
+        Results are cached per TLE pair; each call returns its own copy.
+        """
+        result = self._cached_validation(line1, line2)
+        return replace(result, errors=list(result.errors))
+    
+    def _check_tle(self, line1: str, line2: str) -> TLEValidationResult:
+        """Run the TLE format, checksum and orbital parameter checks."""
         errors = []
         
         # Basic format validation
@@ -374,35 +789,29 @@ class SatelliteCalculator:
         if not line2.startswith('2 '):
             errors.append("Line 2 must start with '2 '")
         
-        # Checksum validation
-        def calculate_checksum(line: str) -> int:
-            """Calculate TLE line checksum."""
-            checksum = 0
-            for char in line[:-1]:
-                if char.isdigit():
-                    checksum += int(char)
-                elif char == '-':
-                    checksum += 1
-            return checksum % 10
+        # Slice fields from ASCII bytes: cheaper than str slices, and int()/float() accept bytes
+        b1 = line1.encode('ascii', 'replace')
+        b2 = line2.encode('ascii', 'replace')
         
+        # Checksum validation
         try:
-            line1_checksum = int(line1[-1])
-            if calculate_checksum(line1) != line1_checksum:
+            line1_checksum = int(b1[-1:])
+            if _tle_checksum_bytes(b1) != line1_checksum:
                 errors.append("Line 1 checksum validation failed")
         except (ValueError, IndexError):
             errors.append("Line 1 checksum format invalid")
         
         try:
-            line2_checksum = int(line2[-1])
-            if calculate_checksum(line2) != line2_checksum:
+            line2_checksum = int(b2[-1:])
+            if _tle_checksum_bytes(b2) != line2_checksum:
                 errors.append("Line 2 checksum validation failed")
         except (ValueError, IndexError):
             errors.append("Line 2 checksum format invalid")
         
         # Satellite number consistency
         try:
-            sat_num_1 = int(line1[2:7])
-            sat_num_2 = int(line2[2:7])
+            sat_num_1 = int(b1[2:7])
+            sat_num_2 = int(b2[2:7])
             if sat_num_1 != sat_num_2:
                 errors.append(f"Satellite numbers don't match: {sat_num_1} vs {sat_num_2}")
         except ValueError:
@@ -421,26 +830,19 @@ class SatelliteCalculator:
         
         if len(errors) == 0:
             try:
-                # Create satellite object to validate orbital parameters
-                satellite = EarthSatellite(line1, line2, ts=self.ts)
+                # Create satellite object to validate orbital parameters (cached for later propagation)
+                satellite = self._load_satellite(line1, line2)
                 
                 satellite_number = sat_num_1
-                classification = line1[7]
-                international_designator = line1[9:17].strip()
+                classification = b1[7:8].decode('ascii')
+                international_designator = b1[9:17].strip().decode('ascii')
                 
-                # Extract epoch
-                epoch_year = int(line1[18:20])
-                epoch_year += 2000 if epoch_year < 57 else 1900  # Two-digit year logic
-                epoch_day = float(line1[20:32])
-                from datetime import timedelta
-                epoch = datetime(epoch_year, 1, 1, tzinfo=timezone.utc)
-                epoch = epoch.replace(day=1) + timedelta(days=int(epoch_day - 1))
-                epoch = epoch + timedelta(milliseconds=int((epoch_day % 1) * 24 * 3600 * 1000))
-                
-                # Orbital parameters
-                inclination_deg = float(line2[8:16])
-                eccentricity = float('0.' + line2[26:33])
-                mean_motion = float(line2[52:63])  # revolutions per day
+                # Epoch as already parsed by SGP4; the elements straight from their
+                # fields, so they are reported exactly as written (SGP4 keeps radians)
+                epoch = satellite.epoch.utc_datetime()
+                inclination_deg = float(b2[8:16])
+                eccentricity = float(b'0.' + b2[26:33])
+                mean_motion = float(b2[52:63])  # revolutions per day
                 orbital_period_minutes = 1440.0 / mean_motion if mean_motion > 0 else None
                 
                 # Validate parameter ranges
@@ -467,36 +869,32 @@ class SatelliteCalculator:
             orbital_period_minutes=orbital_period_minutes
         )
     
-    def calculate_ground_lighting(self, latitude: float, longitude: float, timestamp: datetime) -> Dict[str, Any]:
-        """Calculate ground lighting conditions at a specific time and location."""
-        # Convert to Skyfield time
-        t = self.ts.from_datetime(timestamp.replace(tzinfo=timezone.utc))
-        
-        # Create ground location object
-        location = wgs84.latlon(latitude, longitude)
-        
-        # Calculate sun position
-        sun_apparent = (self.earth + location).at(t).observe(self.sun).apparent()
-        sun_alt, sun_az, _ = sun_apparent.altaz()
-        
-        sun_elevation = sun_alt.degrees
-        
-        # Determine lighting conditions based on sun elevation
-        if sun_elevation > -0.833:  # Above horizon (accounting for atmospheric refraction)
-            condition = "daylight"
-        elif sun_elevation > -6:  # Civil twilight
-            condition = "civil_twilight"
-        elif sun_elevation > -12:  # Nautical twilight
-            condition = "nautical_twilight"
-        elif sun_elevation > -18:  # Astronomical twilight
-            condition = "astronomical_twilight"
+    def _sun_altaz(self, latitude, longitude, t: Time) -> Tuple[np.ndarray, np.ndarray]:
+        """Sun elevation and azimuth in degrees; accepts scalar or array locations and times."""
+        if np.ndim(latitude) == 0:
+            observer = self._observer(latitude, longitude)
         else:
-            condition = "night"
+            # Arrays of locations (e.g. satellite subpoints) are not hashable and rarely repeat
+            observer = self._create_observer(latitude, longitude)
+        sun_alt, sun_az, _ = observer.at(t).observe(self.sun).apparent().altaz()
+        return sun_alt.degrees, sun_az.degrees
+    
+    def _ground_lighting_result(
+        self,
+        sun_elevation: float,
+        sun_azimuth: float,
+        condition_index: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Build the ground lighting dict for a sun elevation/azimuth."""
+        # Determine lighting conditions based on sun elevation
+        if condition_index is None:
+            condition_index = np.searchsorted(SUN_ELEVATION_THRESHOLDS, sun_elevation)
+        condition = LIGHTING_CONDITIONS[condition_index]
         
         return {
             "condition": condition,
             "sun_elevation_deg": round(sun_elevation, 2),
-            "sun_azimuth_deg": round(sun_az.degrees, 2),
+            "sun_azimuth_deg": round(sun_azimuth, 2),
             "civil_twilight": sun_elevation > -6,
             "nautical_twilight": sun_elevation > -12,
             "astronomical_twilight": sun_elevation > -18,
@@ -504,6 +902,53 @@ class SatelliteCalculator:
             "is_night": sun_elevation <= -18
         }
     
+    def _satellite_lighting_result(
+        self,
+        sat_distance: float,
+        sat_lat: float,
+        sat_lon: float,
+        ground_lighting: Dict[str, Any],
+        in_eclipse: bool
+    ) -> Dict[str, Any]:
+        """Build the satellite lighting dict from its position, shadow test and subpoint lighting."""
+        return {
+            "condition": "eclipse" if in_eclipse else "sunlight",
+            "in_eclipse": in_eclipse,
+            "in_sunlight": not in_eclipse,
+            "satellite_altitude_km": round(sat_distance - 6371, 2),  # Altitude above Earth surface
+            "subpoint_latitude": round(sat_lat, 4),
+            "subpoint_longitude": round(sat_lon, 4),
+            "ground_track_lighting": ground_lighting["condition"],
+            "eclipse_calculation": "cylindrical_shadow"
+        }
+    
+    def calculate_ground_lighting(self, latitude: float, longitude: float, timestamp: datetime) -> Dict[str, Any]:
+        """Calculate ground lighting conditions at a specific time and location."""
+        return self.calculate_ground_lighting_batch(latitude, longitude, [timestamp])[0]
+    
+    def calculate_ground_lighting_batch(
+        self,
+        latitude: float,
+        longitude: float,
+        timestamps: List[datetime]
+    ) -> List[Dict[str, Any]]:
+        """Calculate ground lighting conditions at one location for many times.
+        
+        The sun is observed at every timestamp in a single Skyfield call.
+        """
+        if not timestamps:
+            return []
+        
+        # Convert to Skyfield times
+        t = self.ts.from_datetimes([timestamp.replace(tzinfo=timezone.utc) for timestamp in timestamps])
+        
+        sun_elevation, sun_azimuth = self._sun_altaz(latitude, longitude, t)
+        condition_index = np.searchsorted(SUN_ELEVATION_THRESHOLDS, sun_elevation)
+        return [
+            self._ground_lighting_result(sun_elevation[i], sun_azimuth[i], condition_index[i])
+            for i in range(len(timestamps))
+        ]
+    
     def calculate_satellite_lighting(self, satellite: EarthSatellite, timestamp: datetime) -> Dict[str, Any]:
         """Calculate satellite lighting conditions (sunlight/eclipse) at a specific time."""
         # Convert to Skyfield time
@@ -513,249 +958,422 @@ class SatelliteCalculator:
         geocentric = satellite.at(t)
         
         # Get satellite's subpoint for ground lighting reference
-        sat_lat = geocentric.subpoint().latitude.degrees
-        sat_lon = geocentric.subpoint().longitude.degrees
+        subpoint = geocentric.subpoint()
+        sat_lat = subpoint.latitude.degrees
+        sat_lon = subpoint.longitude.degrees
         
         # Calculate ground lighting at satellite's subpoint
         ground_lighting = self.calculate_ground_lighting(sat_lat, sat_lon, timestamp)
         
-        # Get satellite position vector
-        sat_position = geocentric.position.km
-        sat_distance = np.linalg.norm(sat_position)
+        # Get satellite position vector (plain float math is much cheaper than np.linalg.norm for 3 values)
+        x, y, z = geocentric.position.km
+        sat_distance = math.sqrt(x * x + y * y + z * z)
+        in_eclipse = bool(_in_earth_shadow(geocentric.position.km, self._earth_to_sun.at(t).position.km))
         
-        # Simplified eclipse calculation: 
-        # Satellite is in eclipse if it's on the night side of Earth
-        # This is an approximation based on the ground track lighting
+        return self._satellite_lighting_result(sat_distance, sat_lat, sat_lon, ground_lighting, in_eclipse)
+    
+    def _batch_lighting(
+        self,
+        satellite: EarthSatellite,
+        latitude: float,
+        longitude: float,
+        t: Time
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Ground and satellite lighting for an array of times.
         
-        # For LEO satellites, use ground track lighting as approximation
-        # For higher satellites, they're more likely to be in sunlight
-        in_eclipse = False
-        if sat_distance < 2000:  # LEO satellites (below ~2000km)
-            in_eclipse = ground_lighting["condition"] in ["night", "astronomical_twilight"]
-        elif sat_distance < 20000:  # MEO satellites
-            in_eclipse = ground_lighting["condition"] == "night"
-        # GEO and higher satellites are rarely in eclipse, so default to sunlight
+        The sun is observed from the ground station and from every satellite
+        subpoint in a single Skyfield call over the stacked locations.
+        """
+        geocentric = satellite.at(t)
+        subpoint = geocentric.subpoint()
+        sat_lat = subpoint.latitude.degrees
+        sat_lon = subpoint.longitude.degrees
+        sat_distance = np.linalg.norm(geocentric.position.km, axis=0)
+        # Shadow test for every time against one batch of sun positions
+        in_eclipse = _in_earth_shadow(geocentric.position.km, self._earth_to_sun.at(t).position.km)
+        
+        count = len(sat_distance)
+        sun_elevation, sun_azimuth = self._sun_altaz(
+            np.concatenate((np.full(count, float(latitude)), sat_lat)),
+            np.concatenate((np.full(count, float(longitude)), sat_lon)),
+            t[np.tile(np.arange(count), 2)]
+        )
+        condition_index = np.searchsorted(SUN_ELEVATION_THRESHOLDS, sun_elevation)
         
-        return {
-            "condition": "eclipse" if in_eclipse else "sunlight",
-            "in_eclipse": in_eclipse,
-            "in_sunlight": not in_eclipse,
-            "satellite_altitude_km": round(sat_distance - 6371, 2),  # Altitude above Earth surface
-            "subpoint_latitude": round(sat_lat, 4),
-            "subpoint_longitude": round(sat_lon, 4),
-            "ground_track_lighting": ground_lighting["condition"],
-            "eclipse_calculation": "simplified_altitude_based"
-        }
+        # First half: ground station; second half: satellite subpoints
+        ground_lighting = [
+            self._ground_lighting_result(sun_elevation[i], sun_azimuth[i], condition_index[i])
+            for i in range(count)
+        ]
+        satellite_lighting = [
+            self._satellite_lighting_result(
+                sat_distance[i], sat_lat[i], sat_lon[i],
+                self._ground_lighting_result(
+                    sun_elevation[count + i], sun_azimuth[count + i], condition_index[count + i]
+                ),
+                bool(in_eclipse[i])
+            )
+            for i in range(count)
+        ]
+        
+        return ground_lighting, satellite_lighting
     
-    def calculate_access_windows(
+    def _validate_access_inputs(
         self,
         latitude: float,
         longitude: float,
-        tle_line1: str,
-        tle_line2: str,
         start_time: datetime,
         end_time: datetime,
-        elevation_threshold: float = 10.0,
-        time_step_seconds: int = 30
-    ) -> List[AccessWindow]:
-        """Calculate satellite access windows for a ground station."""
-        
-        # Validate inputs
+        elevation_threshold: float
+    ) -> None:
+        """Validate ground station and time window inputs."""
         if not (-90 <= latitude <= 90):
             raise ValueError(f"Invalid latitude: {latitude}")
         if not (-180 <= longitude <= 180):
             raise ValueError(f"Invalid longitude: {longitude}")
+        self._validate_time_window(start_time, end_time, elevation_threshold)
+    
+    def _validate_time_window(self, start_time: datetime, end_time: datetime, elevation_threshold: float = 0.0) -> None:
+        """Validate the location-independent inputs of an access calculation."""
         if elevation_threshold < 0 or elevation_threshold > 90:
             raise ValueError(f"Invalid elevation threshold: {elevation_threshold}")
         if start_time >= end_time:
             raise ValueError("Start time must be before end time")
+    
+    def _build_time_grid(self, start_time: datetime, end_time: datetime, time_step_seconds: int) -> Optional[Time]:
+        """Build the array of sample times between start and end (inclusive)."""
+        start_time = start_time.replace(tzinfo=timezone.utc)
+        end_time = end_time.replace(tzinfo=timezone.utc)
+        
+        span_seconds = (end_time - start_time).total_seconds()
+        if span_seconds < 0:
+            return None
+        
+        # Offsets are added to the fractional part so the whole-day part keeps full precision
+        t_start = self.ts.from_datetime(start_time)
+        offsets_days = np.arange(int(span_seconds // time_step_seconds) + 1) * (time_step_seconds / 86400.0)
+        return self.ts.tt_jd(t_start.whole, t_start.tt_fraction + offsets_days)
+    
+    def _utc_datetime64(self, t: Time) -> np.ndarray:
+        """Convert an array Time to UTC datetime64[us] without building datetime objects.
+        
+        Rounds like Time.utc_datetime(): to the microsecond below t + 0.5 us,
+        with leap seconds clamped to :59.
+        """
+        _, _, _, hour, minute, second, jd = t._utc_tuple(0.5e-6, return_jd=True)
+        micro = (second * 1e6).astype(np.int64)
+        micro -= micro // 60_000_000 * 1_000_000
+        # jd is the Julian day number of the UTC date; 2440588 is 1970-01-01
+        day_start = (jd - 2440588) * 86_400_000_000 + (hour * 3600 + minute * 60) * 1_000_000
+        return (day_start + micro).astype('datetime64[us]')
+    
+    def _horizon_basis(self, latitude, longitude) -> np.ndarray:
+        """Return the station's north, east and up unit vectors in the ITRS frame.
+        
+        Scalar coordinates give a (3, 3) array; arrays of N coordinates give
+        one basis per station, shape (N, 3, 3).
+        """
+        lat = np.radians(latitude)
+        lon = np.radians(longitude)
+        sin_lat, cos_lat = np.sin(lat), np.cos(lat)
+        sin_lon, cos_lon = np.sin(lon), np.cos(lon)
+        basis = np.array([
+            [-sin_lat * cos_lon, -sin_lat * sin_lon, cos_lat],
+            [-sin_lon, cos_lon, np.zeros_like(lat)],
+            [cos_lat * cos_lon, cos_lat * sin_lon, sin_lat],
+        ])
+        return np.moveaxis(basis, -1, 0) if basis.ndim == 3 else basis
+    
+    def _extract_access_windows(
+        self,
+        satellite: EarthSatellite,
+        latitude: float,
+        longitude: float,
+        times: Time,
+        topocentric_km: np.ndarray,
+        elevation_threshold: float,
+        basis: Optional[np.ndarray] = None,
+        sin_elevation: Optional[np.ndarray] = None
+    ) -> AccessWindowArray:
+        """Find access windows in a sampled station-to-satellite ITRS vector.
+        
+        Only sin(elevation) is computed per sample; elevation and azimuth
+        angles are evaluated at the AOS, culmination and LOS samples.
+        Callers that batch stations may pass the station's horizon basis and
+        the precomputed sin(elevation) samples.
+        """
+        if basis is None:
+            basis = self._horizon_basis(latitude, longitude)
+        if sin_elevation is None:
+            # einsum contracts in place, without norm()'s squared temporaries
+            sin_elevation = basis[2] @ topocentric_km
+            sin_elevation /= np.sqrt(np.einsum('kt,kt->t', topocentric_km, topocentric_km))
+        sin_threshold = math.sin(math.radians(elevation_threshold))
+        
+        # (aos, los, culmination) sample indices for each window
+        events = _find_access_events(sin_elevation, sin_threshold)
+        if len(events) == 0:
+            return AccessWindowArray.empty()
+        
+        # AOS/LOS are interpolated between samples to the threshold crossing;
+        # convert all events in one call each for UTC and horizon coordinates
+        event_pos = _interpolate_crossings(sin_elevation, events, sin_threshold).ravel()
+        event_idx = np.minimum(event_pos.astype(int), len(sin_elevation) - 2) if len(sin_elevation) > 1 else event_pos.astype(int)
+        frac = event_pos - event_idx
+        next_idx = np.minimum(event_idx + 1, len(sin_elevation) - 1)
+        
+        tt_fraction = times.tt_fraction
+        whole = np.broadcast_to(times.whole, tt_fraction.shape)
+        event_times = self._utc_datetime64(self.ts.tt_jd(
+            whole[event_idx], tt_fraction[event_idx] + frac * (tt_fraction[next_idx] - tt_fraction[event_idx])
+        ))
+        event_km = topocentric_km[:, event_idx] + frac * (topocentric_km[:, next_idx] - topocentric_km[:, event_idx])
+        north, east, up = basis @ event_km
+        azimuth_deg = np.degrees(np.arctan2(east, north)) % 360.0
+        elevation_deg = np.degrees(np.arctan2(up, np.hypot(north, east)))
+        
+        # Calculate lighting conditions at every culmination in one batch
+        ground_lighting, satellite_lighting = self._batch_lighting(
+            satellite, latitude, longitude, times[events[:, 2]]
+        )
+        
+        # Events are stored as (aos, los, culmination) triples
+        aos_time, los_time, culmination_time = event_times[0::3], event_times[1::3], event_times[2::3]
+        return AccessWindowArray(
+            aos_time=aos_time,
+            los_time=los_time,
+            culmination_time=culmination_time,
+            duration_seconds=(los_time - aos_time) / np.timedelta64(1, 's'),
+            max_elevation_deg=elevation_deg[2::3],
+            aos_azimuth_deg=azimuth_deg[0::3],
+            los_azimuth_deg=azimuth_deg[1::3],
+            culmination_azimuth_deg=azimuth_deg[2::3],
+            ground_lighting=ground_lighting,
+            satellite_lighting=satellite_lighting
+        )
+    
+    def calculate_access_windows(
+        self,
+        latitude: float,
+        longitude: float,
+        tle_line1: str,
+        tle_line2: str,
+        start_time: datetime,
+        end_time: datetime,
+        elevation_threshold: float = 10.0,
+        time_step_seconds: int = 30,
+        times: Optional[Time] = None,
+        mode: str = 'adaptive',
+        altitude: float = 0.0
+    ) -> AccessWindowArray:
+        """Calculate satellite access windows for a ground station.
+        
+        ``altitude`` is the station's height above the WGS84 ellipsoid in meters.
+        The windows are returned column-wise; iterating or indexing the result
+        gives AccessWindow objects.
+        
+        In 'adaptive' mode the satellite is first screened on a coarse grid
+        and only samples of the fine grid near a possible pass are
+        propagated; 'uniform' propagates every sample. Both give the same
+        windows.
+        
+        A prebuilt ``times`` grid (from ``_build_time_grid`` with the same
+        start, end and step) may be passed when several calls share one
+        window, so Skyfield's Earth-orientation terms cached on it are reused.
+        """
+        if mode not in ('adaptive', 'uniform'):
+            raise ValueError(f"Invalid mode: {mode}")
+        
+        # Validate inputs
+        self._validate_access_inputs(latitude, longitude, start_time, end_time, elevation_threshold)
         
         # Validate TLE
         tle_validation = self.validate_tle(tle_line1, tle_line2)
         if not tle_validation.is_valid:
             raise ValueError(f"Invalid TLE: {'; '.join(tle_validation.errors)}")
         
-        # Create ground station and satellite objects
-        ground_station = Topos(latitude_degrees=latitude, longitude_degrees=longitude)
-        satellite = EarthSatellite(tle_line1, tle_line2, ts=self.ts)
-        
-        # Create time range
-        t_start = self.ts.from_datetime(start_time.replace(tzinfo=timezone.utc))
-        t_end = self.ts.from_datetime(end_time.replace(tzinfo=timezone.utc))
+        # Ground station frame and satellite object
+        station_km, basis = self._station_frame(latitude, longitude, altitude)
+        satellite = self._load_satellite(tle_line1, tle_line2)
         
-        # Calculate satellite positions at regular intervals
-        time_points = []
-        current_time = t_start
-        while current_time.tt <= t_end.tt:
-            time_points.append(current_time)
-            current_time = self.ts.tt_jd(current_time.tt + time_step_seconds / 86400.0)
+        if times is None:
+            times = self._build_time_grid(start_time, end_time, time_step_seconds)
+            if times is None:
+                return AccessWindowArray.empty()
         
-        if not time_points:
-            return []
-        
-        times = self.ts.tt_jd([t.tt for t in time_points])
-        
-        # Calculate topocentric coordinates
-        difference = satellite - ground_station
-        topocentric = difference.at(times)
-        elevation, azimuth, distance = topocentric.altaz()
-        
-        # Find access windows
-        access_windows = []
-        in_access = False
-        aos_idx = None
-        culmination_idx = None
-        max_elevation = -90.0
-        
-        for i, (elev_deg, az_deg) in enumerate(zip(elevation.degrees, azimuth.degrees)):
-            if elev_deg >= elevation_threshold and not in_access:
-                # Access start (AOS)
-                in_access = True
-                aos_idx = i
-                culmination_idx = i
-                max_elevation = elev_deg
-                
-            elif elev_deg >= elevation_threshold and in_access:
-                # Continue access - check for new maximum
-                if elev_deg > max_elevation:
-                    max_elevation = elev_deg
-                    culmination_idx = i
-                    
-            elif elev_deg < elevation_threshold and in_access:
-                # Access end (LOS)
-                in_access = False
-                los_idx = i - 1 if i > 0 else i
-                
-                # Create access window
-                aos_time = time_points[aos_idx].utc_datetime()
-                los_time = time_points[los_idx].utc_datetime()
-                culmination_time = time_points[culmination_idx].utc_datetime()
-                
-                duration_seconds = (los_time - aos_time).total_seconds()
-                
-                # Calculate lighting conditions at culmination
-                ground_lighting = self.calculate_ground_lighting(latitude, longitude, culmination_time)
-                satellite_lighting = self.calculate_satellite_lighting(satellite, culmination_time)
-                
-                access_window = AccessWindow(
-                    aos_time=aos_time,
-                    los_time=los_time,
-                    culmination_time=culmination_time,
-                    duration_seconds=duration_seconds,
-                    max_elevation_deg=max_elevation,
-                    aos_azimuth_deg=azimuth.degrees[aos_idx],
-                    los_azimuth_deg=azimuth.degrees[los_idx],
-                    culmination_azimuth_deg=azimuth.degrees[culmination_idx],
-                    ground_lighting=ground_lighting,
-                    satellite_lighting=satellite_lighting
-                )
-                
-                access_windows.append(access_window)
-        
-        # Handle case where access window extends beyond end time
-        if in_access and aos_idx is not None:
-            los_idx = len(time_points) - 1
-            aos_time = time_points[aos_idx].utc_datetime()
-            los_time = time_points[los_idx].utc_datetime()
-            culmination_time = time_points[culmination_idx].utc_datetime()
-            
-            duration_seconds = (los_time - aos_time).total_seconds()
-            
-            # Calculate lighting conditions at culmination
-            ground_lighting = self.calculate_ground_lighting(latitude, longitude, culmination_time)
-            satellite_lighting = self.calculate_satellite_lighting(satellite, culmination_time)
-            
-            access_window = AccessWindow(
-                aos_time=aos_time,
-                los_time=los_time,
-                culmination_time=culmination_time,
-                duration_seconds=duration_seconds,
-                max_elevation_deg=max_elevation,
-                aos_azimuth_deg=azimuth.degrees[aos_idx],
-                los_azimuth_deg=azimuth.degrees[los_idx],
-                culmination_azimuth_deg=azimuth.degrees[culmination_idx],
-                ground_lighting=ground_lighting,
-                satellite_lighting=satellite_lighting
+        if mode == 'adaptive':
+            # Keep only samples that can be in view; the screening margin
+            # guarantees that no run of in-access samples touches a gap
+            sample_idx = self._find_candidate_passes(
+                satellite, station_km, times, elevation_threshold, time_step_seconds
             )
-            
-            access_windows.append(access_window)
+            if len(sample_idx) == 0:
+                logger.info("Found 0 access windows")
+                return AccessWindowArray.empty()
+            if len(sample_idx) < len(times):
+                times = times[sample_idx]
+        
+        # Station-to-satellite vector in the Earth-fixed frame, from one batched SGP4 call;
+        # the horizon scan runs in float32, as in the bulk path
+        topocentric_km = self._propagate_itrs([satellite], times)[0] - station_km[:, np.newaxis]
+        
+        access_windows = self._extract_access_windows(
+            satellite, latitude, longitude, times, topocentric_km.astype(np.float32), elevation_threshold,
+            basis=basis.astype(np.float32)
+        )
         
         logger.info(f"Found {len(access_windows)} access windows")
         return access_windows
     
+    def _find_candidate_passes(
+        self,
+        satellite: EarthSatellite,
+        station_km: np.ndarray,
+        times: Time,
+        elevation_threshold: float,
+        time_step_seconds: int
+    ) -> np.ndarray:
+        """Screen a time grid on coarse samples for possible passes over a station.
+        
+        A coarse sample is a candidate when the Earth-central angle between
+        the station and the satellite is within the widest visibility cone
+        (at apogee) plus the farthest the sub-satellite point can move in
+        one coarse step.
+        
+        Returns:
+            Sorted indices into ``times`` covering every fine sample within
+            one coarse step of a candidate
+        """
+        n = len(times)
+        stride = max(1, COARSE_SEARCH_STEP_SECONDS // time_step_seconds)
+        coarse_idx = np.arange(0, n + stride - 1, stride).clip(max=n - 1)
+        
+        position_km = self._propagate_itrs([satellite], times[coarse_idx])[0]
+        station_radius_km = np.linalg.norm(station_km)
+        cos_central = (station_km / station_radius_km) @ position_km / np.linalg.norm(position_km, axis=0)
+        
+        model = satellite.model
+        elevation = math.radians(elevation_threshold)
+        apogee_radius_km = (1.0 + model.alta) * model.radiusearthkm
+        visibility_angle = math.acos(min(1.0, station_radius_km / apogee_radius_km * math.cos(elevation))) - elevation
+        # Fastest ground-track motion: angular rate at perigee plus Earth rotation (rad/s)
+        ecc = model.ecco
+        max_rate = model.no_kozai / 60.0 * (1.0 + ecc) ** 2 / (1.0 - ecc ** 2) ** 1.5 + ANGVEL
+        # Extra degree of slack covers geodetic vs geocentric vertical and the ITRS approximation
+        max_angle = visibility_angle + max_rate * stride * time_step_seconds + math.radians(1.0)
+        if max_angle >= math.pi:
+            return np.arange(n)
+        
+        candidates = coarse_idx[cos_central > math.cos(max_angle)]
+        mask = np.zeros(n + 1, dtype=np.int32)
+        np.add.at(mask, (candidates - stride).clip(min=0), 1)
+        np.add.at(mask, (candidates + stride + 1).clip(max=n), -1)
+        return np.flatnonzero(np.cumsum(mask[:n]) > 0)
+    
+    def calculate_access_windows_multi(
+        self,
+        satellites: List[Dict[str, str]],
+        latitude: float,
+        longitude: float,
+        start_time: datetime,
+        end_time: datetime,
+        elevation_threshold: float = 10.0,
+        time_step_seconds: int = 30,
+        altitude: float = 0.0
+    ) -> List[AccessWindowArray]:
+        """Calculate access windows for several satellites over one ground station.
+        
+        ``altitude`` is the station's height above the WGS84 ellipsoid in meters.
+        The time array is built once and shared by every satellite, so
+        Skyfield computes its Earth-orientation terms only once.
+        
+        Args:
+            satellites: List of dicts with 'tle_line1' and 'tle_line2'
+            latitude: Ground station latitude in degrees
+            longitude: Ground station longitude in degrees
+            start_time: Start time for calculations
+            end_time: End time for calculations
+            elevation_threshold: Minimum elevation angle in degrees
+            time_step_seconds: Time step for calculations
+            altitude: Ground station altitude in meters
+            
+        Returns:
+            One AccessWindowArray per satellite, in input order
+        """
+        self._validate_access_inputs(latitude, longitude, start_time, end_time, elevation_threshold)
+        
+        satellite_objects = []
+        for sat_data in satellites:
+            tle_validation = self.validate_tle(sat_data['tle_line1'], sat_data['tle_line2'])
+            if not tle_validation.is_valid:
+                raise ValueError(f"Invalid TLE: {'; '.join(tle_validation.errors)}")
+            satellite_objects.append(self._load_satellite(sat_data['tle_line1'], sat_data['tle_line2']))
+        
+        times = self._build_time_grid(start_time, end_time, time_step_seconds)
+        if times is None:
+            return [AccessWindowArray.empty() for _ in satellite_objects]
+        
+        if not satellite_objects:
+            return []
+        
+        # Every satellite is propagated over the grid in one SGP4 call, and
+        # sin(elevation) of all of them is taken against the shared horizon basis
+        station_km, basis = self._station_frame(latitude, longitude, altitude)
+        topocentric_km = (self._propagate_itrs(satellite_objects, times) - station_km[:, np.newaxis]).astype(np.float32)
+        basis = basis.astype(np.float32)
+        sin_elevation = np.einsum('k,skt->st', basis[2], topocentric_km)
+        sin_elevation /= np.sqrt(np.einsum('skt,skt->st', topocentric_km, topocentric_km))
+        
+        results = []
+        for j, satellite in enumerate(satellite_objects):
+            results.append(self._extract_access_windows(
+                satellite, latitude, longitude, times, topocentric_km[j], elevation_threshold,
+                basis=basis, sin_elevation=sin_elevation[j]
+            ))
+        
+        logger.info(f"Found {sum(len(w) for w in results)} access windows for {len(results)} satellites")
+        return results
+    
     def parse_locations_from_csv_content(self, csv_content: str) -> List[Dict[str, Any]]:
         """Parse locations from CSV content with flexible format handling."""
-        import csv
-        import io
-        
-        lines = csv_content.strip().split('\n')
-        if not lines:
+        # Checked without copying or splitting the content, which the CSV reader scans anyway
+        if not csv_content or csv_content.isspace():
             raise ValueError("CSV content is empty")
         
-        # Parse header to identify columns
-        reader = csv.DictReader(io.StringIO(csv_content))
-        
-        locations = []
-        for row_num, row in enumerate(reader, 1):
-            try:
-                location = {}
-                
-                # Find latitude column (flexible naming)
-                lat_keys = ['latitude', 'lat', 'Latitude', 'Lat', 'LATITUDE', 'LAT']
-                lat_value = None
-                for key in lat_keys:
-                    if key in row and row[key].strip():
-                        lat_value = float(row[key])
-                        break
-                
-                if lat_value is None:
-                    raise ValueError(f"No latitude column found in row {row_num}")
-                
-                # Find longitude column (flexible naming)
-                lon_keys = ['longitude', 'lon', 'lng', 'Longitude', 'Lon', 'Lng', 'LONGITUDE', 'LON', 'LNG']
-                lon_value = None
-                for key in lon_keys:
-                    if key in row and row[key].strip():
-                        lon_value = float(row[key])
-                        break
-                
-                if lon_value is None:
-                    raise ValueError(f"No longitude column found in row {row_num}")
-                
-                # Find altitude column (optional, default to sea level)
-                alt_keys = ['altitude', 'alt', 'elevation', 'elev', 'Altitude', 'Alt', 'Elevation', 'Elev']
-                alt_value = 0.0  # Default to sea level
-                for key in alt_keys:
-                    if key in row and row[key].strip():
-                        alt_value = float(row[key])
-                        break
-                
-                # Find name column (optional)
-                name_keys = ['name', 'Name', 'NAME', 'site', 'Site', 'SITE', 'station', 'Station', 'STATION']
-                name_value = f"Location_{row_num}"  # Default name
-                for key in name_keys:
-                    if key in row and row[key].strip():
-                        name_value = row[key].strip()
-                        break
-                
-                location = {
-                    'name': name_value,
-                    'latitude': lat_value,
-                    'longitude': lon_value,
-                    'altitude': alt_value
-                }
-                
-                # Validate coordinates
-                if not (-90 <= lat_value <= 90):
-                    raise ValueError(f"Invalid latitude {lat_value} in row {row_num}")
-                if not (-180 <= lon_value <= 180):
-                    raise ValueError(f"Invalid longitude {lon_value} in row {row_num}")
-                
-                locations.append(location)
-                
-            except Exception as e:
-                logger.warning(f"Skipping row {row_num}: {str(e)}")
-                continue
+        # Resolve columns (flexible naming); the first candidate present in the header wins
+        columns = self._read_csv_columns(csv_content, {
+            'latitude': ['latitude', 'lat', 'Latitude', 'Lat', 'LATITUDE', 'LAT'],
+            'longitude': ['longitude', 'lon', 'lng', 'Longitude', 'Lon', 'Lng', 'LONGITUDE', 'LON', 'LNG'],
+            'altitude': ['altitude', 'alt', 'elevation', 'elev', 'Altitude', 'Alt', 'Elevation', 'Elev'],
+            'name': ['name', 'Name', 'NAME', 'site', 'Site', 'SITE', 'station', 'Station', 'STATION'],
+        })
+        lat_values = columns['latitude']
+        lon_values = columns['longitude']
+        alt_values = [value or '0' for value in columns['altitude']]  # Default to sea level
+        name_values = columns['name']
+        
+        # Numeric columns are converted in one call each; unparseable cells become NaN
+        lats = self._csv_floats(lat_values)
+        lons = self._csv_floats(lon_values)
+        alts = self._csv_floats(alt_values)
+        
+        # NaN fails every comparison, so missing and unparseable cells are rejected here too
+        valid = (lats >= -90) & (lats <= 90) & (lons >= -180) & (lons <= 180) & np.isfinite(alts)
+        if not valid.all():
+            skipped_rows = (np.flatnonzero(~valid) + 1).tolist()
+            logger.warning(f"Skipping rows {skipped_rows}: missing, unparseable or out-of-range coordinates")
+        
+        locations = [
+            {
+                'name': name_values[i] or f"Location_{i + 1}",
+                'latitude': lat_value,
+                'longitude': lon_value,
+                'altitude': alt_value
+            }
+            for i, lat_value, lon_value, alt_value in zip(
+                np.flatnonzero(valid).tolist(), lats[valid].tolist(), lons[valid].tolist(), alts[valid].tolist()
+            )
+        ]
         
         if not locations:
             raise ValueError("No valid locations found in CSV")
@@ -763,68 +1381,100 @@ class SatelliteCalculator:
         logger.info(f"Parsed {len(locations)} locations from CSV")
         return locations
     
-    def parse_satellites_from_csv_content(self, csv_content: str) -> List[Dict[str, Any]]:
-        """Parse satellites from CSV content with TLE data."""
+    def _read_csv_columns(self, csv_content: str, columns: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        """Read CSV content column-wise.
+        
+        Args:
+            csv_content: CSV text with a header row
+            columns: Candidate header names for each logical column
+            
+        Returns:
+            Stripped cell values per logical column, one per non-blank data
+            row ('' where the column or cell is missing)
+        """
         import csv
         import io
         
-        lines = csv_content.strip().split('\n')
-        if not lines:
+        # Parse header to identify columns once, then read all data rows
+        reader = csv.reader(io.StringIO(csv_content))
+        header = {name: index for index, name in enumerate(next(reader, []))}
+        rows = [row for row in reader if row]  # Blank lines are skipped, as csv.DictReader does
+        
+        resolved = {key: self._find_csv_column(header, candidates) for key, candidates in columns.items()}
+        return {key: [self._csv_cell(row, column) for row in rows] for key, column in resolved.items()}
+    
+    def _find_csv_column(self, header: Dict[str, int], candidates: List[str]) -> Optional[int]:
+        """Return the index of the first candidate column present in the header."""
+        return next((header[key] for key in candidates if key in header), None)
+    
+    def _csv_cell(self, row: List[str], column: Optional[int]) -> str:
+        """Return a stripped cell value, or '' when the column or cell is missing."""
+        if column is None or column >= len(row):
+            return ''
+        return row[column].strip()
+    
+    def _csv_floats(self, values: List[str]) -> np.ndarray:
+        """Convert CSV cells to floats in one call, with NaN for cells that do not parse."""
+        try:
+            return np.array(values, dtype=float)
+        except ValueError:
+            array = np.full(len(values), np.nan)
+            for i, value in enumerate(values):
+                try:
+                    array[i] = float(value)
+                except ValueError:
+                    pass
+            return array
+    
+    def parse_satellites_from_csv_content(self, csv_content: str) -> List[Dict[str, Any]]:
+        """Parse satellites from CSV content with TLE data."""
+        # Checked without copying or splitting the content, which the CSV reader scans anyway
+        if not csv_content or csv_content.isspace():
             raise ValueError("CSV content is empty")
         
-        reader = csv.DictReader(io.StringIO(csv_content))
+        columns = self._read_csv_columns(csv_content, {
+            'name': ['name', 'Name', 'NAME', 'satellite', 'Satellite', 'SATELLITE', 'sat_name'],
+            'tle_line1': ['tle_line1', 'tle1', 'line1', 'TLE_LINE1', 'TLE1', 'LINE1'],
+            'tle_line2': ['tle_line2', 'tle2', 'line2', 'TLE_LINE2', 'TLE2', 'LINE2'],
+        })
         
         satellites = []
-        for row_num, row in enumerate(reader, 1):
-            try:
-                satellite = {}
-                
-                # Find name column
-                name_keys = ['name', 'Name', 'NAME', 'satellite', 'Satellite', 'SATELLITE', 'sat_name']
-                name_value = f"Satellite_{row_num}"
-                for key in name_keys:
-                    if key in row and row[key].strip():
-                        name_value = row[key].strip()
-                        break
-                
-                # Find TLE line 1
-                tle1_keys = ['tle_line1', 'tle1', 'line1', 'TLE_LINE1', 'TLE1', 'LINE1']
-                tle1_value = None
-                for key in tle1_keys:
-                    if key in row and row[key].strip():
-                        tle1_value = row[key].strip()
-                        break
-                
-                if not tle1_value:
-                    raise ValueError(f"No TLE line 1 found in row {row_num}")
-                
-                # Find TLE line 2
-                tle2_keys = ['tle_line2', 'tle2', 'line2', 'TLE_LINE2', 'TLE2', 'LINE2']
-                tle2_value = None
-                for key in tle2_keys:
-                    if key in row and row[key].strip():
-                        tle2_value = row[key].strip()
-                        break
-                
-                if not tle2_value:
-                    raise ValueError(f"No TLE line 2 found in row {row_num}")
-                
-                # Validate TLE
-                tle_validation = self.validate_tle(tle1_value, tle2_value)
-                if not tle_validation.is_valid:
-                    raise ValueError(f"Invalid TLE: {'; '.join(tle_validation.errors)}")
-                
-                satellite = {
-                    'name': name_value,
-                    'tle_line1': tle1_value,
-                    'tle_line2': tle2_value
-                }
-                
-                satellites.append(satellite)
-                
-            except Exception as e:
-                logger.warning(f"Skipping satellite row {row_num}: {str(e)}")
+        skipped = []
+        for row_num, (name_value, tle1_value, tle2_value) in enumerate(
+            zip(columns['name'], columns['tle_line1'], columns['tle_line2']), 1
+        ):
+            if not tle1_value:
+                skipped.append(f"row {row_num}: No TLE line 1 found")
+                continue
+            if not tle2_value:
+                skipped.append(f"row {row_num}: No TLE line 2 found")
                 continue
+            
+            satellites.append({
+                'name': name_value or f"Satellite_{row_num}",
+                'tle_line1': tle1_value,
+                'tle_line2': tle2_value,
+                'row': row_num
+            })
+        
+        # Validate each distinct TLE once (read-only use, so the cached result is not copied),
+        # then keep the rows whose TLE passed
+        validations = {
+            (sat['tle_line1'], sat['tle_line2']): self._cached_validation(sat['tle_line1'], sat['tle_line2'])
+            for sat in satellites
+        }
+        valid_satellites = []
+        for sat in satellites:
+            row_num = sat.pop('row')
+            tle_validation = validations[sat['tle_line1'], sat['tle_line2']]
+            if tle_validation.is_valid:
+                valid_satellites.append(sat)
+            else:
+                skipped.append(f"row {row_num}: Invalid TLE: {'; '.join(tle_validation.errors)}")
+        satellites = valid_satellites
+        
+        if skipped:
+            logger.warning(f"Skipping satellite {', '.join(skipped)}")
         
         if not satellites:
             raise ValueError("No valid satellites found in CSV")
@@ -842,87 +1492,202 @@ class SatelliteCalculator:
         time_step_seconds: int = 30
     ) -> Dict[str, Any]:
         """Calculate access windows for multiple satellites and locations."""
+        combination_results = []
+        summary = self.calculate_bulk_access_windows_stream(
+            locations_csv, satellites_csv, start_time, end_time,
+            elevation_threshold, time_step_seconds, sink=combination_results.append
+        )
+        return {'summary': summary, 'results': combination_results}
+    
+    def calculate_bulk_access_windows_stream(
+        self,
+        locations_csv: str,
+        satellites_csv: str,
+        start_time: datetime,
+        end_time: datetime,
+        elevation_threshold: float = 10.0,
+        time_step_seconds: int = 30,
+        sink: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """Calculate bulk access windows, passing each combination result to a sink.
         
+        Results are handed to ``sink`` as soon as they are available instead
+        of being accumulated, so memory does not grow with the number of
+        combinations. Worker processes get tasks of about
+        BULK_TASK_COMBINATIONS pairs (at least one location against every
+        satellite), and only two tasks per worker are in flight at a time.
+        
+        Returns:
+            The summary section of calculate_bulk_access_windows' result
+        """
         # Parse locations and satellites from CSV content
         locations = self.parse_locations_from_csv_content(locations_csv)
         satellites = self.parse_satellites_from_csv_content(satellites_csv)
         
-        results = {
-            'summary': {
-                'total_locations': len(locations),
-                'total_satellites': len(satellites),
-                'total_combinations': len(locations) * len(satellites),
-                'calculation_parameters': {
-                    'start_time': start_time.isoformat(),
-                    'end_time': end_time.isoformat(),
-                    'elevation_threshold': elevation_threshold,
-                    'time_step_seconds': time_step_seconds
-                }
-            },
-            'results': []
+        total_combinations = len(locations) * len(satellites)
+        if total_combinations > BULK_MAX_COMBINATIONS:
+            raise ValueError(
+                f"Too many combinations: {len(locations)} locations x {len(satellites)} satellites "
+                f"= {total_combinations} (maximum {BULK_MAX_COMBINATIONS})"
+            )
+        
+        summary = {
+            'total_locations': len(locations),
+            'total_satellites': len(satellites),
+            'total_combinations': total_combinations,
+            'calculation_parameters': {
+                'start_time': start_time.isoformat(),
+                'end_time': end_time.isoformat(),
+                'elevation_threshold': elevation_threshold,
+                'time_step_seconds': time_step_seconds
+            }
         }
         
-        total_combinations = len(locations) * len(satellites)
-        current_combination = 0
+        workers = min(os.cpu_count() or 1, len(locations))
+        if total_combinations < BULK_PARALLEL_MIN_COMBINATIONS or workers == 1:
+            # Too few combinations (or locations to split) to pay for worker processes
+            chunk_results = [self._bulk_location_chunk(
+                locations, satellites, start_time, end_time, elevation_threshold, time_step_seconds
+            )]
+            executor = None
+        else:
+            # Each task propagates every satellite once for a small chunk of
+            # locations, so the list a worker sends back stays bounded
+            chunk_size = max(1, min(BULK_TASK_COMBINATIONS // len(satellites), -(-len(locations) // workers)))
+            chunks = (
+                (locations[i:i + chunk_size], satellites, start_time, end_time, elevation_threshold, time_step_seconds)
+                for i in range(0, len(locations), chunk_size)
+            )
+            executor = self._bulk_executor()
+            chunk_results = _map_bounded(executor, _compute_bulk_chunk, chunks, 2 * workers)
         
-        for location in locations:
-            for satellite in satellites:
-                current_combination += 1
-                logger.info(f"Processing combination {current_combination}/{total_combinations}: {satellite['name']} over {location['name']}")
-                
+        # Progress is logged about every 1% rather than per combination
+        log_every = max(1, total_combinations // 100)
+        total_windows = 0
+        total_duration = 0
+        try:
+            current_combination = 0
+            for combination_results in chunk_results:
+                for combination_result in combination_results:
+                    current_combination += 1
+                    if current_combination % log_every == 0 or current_combination == total_combinations:
+                        logger.info(
+                            f"Processed combination {current_combination}/{total_combinations}: "
+                            f"{combination_result['satellite']['name']} over {combination_result['location']['name']}"
+                        )
+                    total_windows += combination_result['summary']['total_windows']
+                    total_duration += combination_result['summary']['total_duration_seconds']
+                    if sink is not None:
+                        sink(combination_result)
+        except BrokenProcessPool:
+            # A worker died; the next call starts a fresh pool
+            with self._bulk_pool_lock:
+                if self._bulk_pool is executor:
+                    self._bulk_pool = None
+            executor.shutdown(wait=False)
+            raise
+        finally:
+            if executor is not None:
+                # Cancels chunks not yet started if the loop ended early
+                chunk_results.close()
+        
+        # Overall summary statistics
+        summary['total_access_windows'] = total_windows
+        summary['total_access_duration_seconds'] = total_duration
+        summary['total_access_duration_minutes'] = round(total_duration / 60.0, 2)
+        
+        logger.info(f"Bulk calculation completed: {total_windows} total access windows found")
+        return summary
+    
+    def _propagate_itrs(self, satellites: List[EarthSatellite], times: Time) -> np.ndarray:
+        """Propagate several satellites over a time array with one vectorized SGP4 call.
+        
+        Returns Earth-fixed positions in km with shape (n_satellites, 3, n_times).
+        The TEME -> Earth-fixed step is the GMST (1982) rotation about the
+        pole; polar motion is neglected, as in Skyfield's ITRS frame.
+        """
+        sat_array = SatrecArray([satellite.model for satellite in satellites])
+        # TLE epochs are UTC, so SGP4 is fed UTC Julian dates (as EarthSatellite does)
+        fraction = times.tai_fraction - times._leap_seconds() / 86400.0
+        _, r_teme, _ = sat_array.sgp4(times.whole, fraction)
+        
+        theta, _ = theta_GMST1982(times.whole, times.ut1_fraction)
+        cos_theta = np.cos(theta)
+        sin_theta = np.sin(theta)
+        x, y, z = r_teme[..., 0], r_teme[..., 1], r_teme[..., 2]
+        return np.stack((cos_theta * x + sin_theta * y, cos_theta * y - sin_theta * x, z), axis=1)
+    
+    def _bulk_location_chunk(
+        self,
+        locations: List[Dict[str, Any]],
+        satellites: List[Dict[str, Any]],
+        start_time: datetime,
+        end_time: datetime,
+        elevation_threshold: float,
+        time_step_seconds: int
+    ) -> Iterator[Dict[str, Any]]:
+        """Calculate and format the access windows of every location/satellite pair in a chunk.
+        
+        All satellites are propagated once over the shared time grid; each
+        location then only differences those positions with its own.
+        Results are yielded pair by pair.
+        """
+        times = None
+        positions = None
+        propagation_error = None
+        try:
+            # An invalid window fails every pair, so check it before propagating anything
+            self._validate_time_window(start_time, end_time, elevation_threshold)
+            times = self._build_time_grid(start_time, end_time, time_step_seconds)
+            if times is not None:
+                # Geometry after propagation is float32: ~0.5 m position error is far
+                # below the reported precision and halves the memory traffic
+                positions = self._propagate_itrs(
+                    [self._load_satellite(sat['tle_line1'], sat['tle_line2']) for sat in satellites], times
+                ).astype(np.float32)
+                # Station positions and horizon bases for the whole chunk, shapes (N, 3) and (N, 3, 3)
+                latitudes = np.array([location['latitude'] for location in locations], dtype=float)
+                longitudes = np.array([location['longitude'] for location in locations], dtype=float)
+                altitudes = np.array([location.get('altitude', 0.0) for location in locations], dtype=float)
+                stations_km = Topos(
+                    latitude_degrees=latitudes, longitude_degrees=longitudes, elevation_m=altitudes
+                ).itrs_xyz.km.T.astype(np.float32)
+                bases = self._horizon_basis(latitudes, longitudes).astype(np.float32)
+        except Exception as e:
+            propagation_error = e
+        
+        for i, location in enumerate(locations):
+            topocentric_km = None
+            for j, satellite in enumerate(satellites):
                 try:
-                    access_windows = self.calculate_access_windows(
-                        latitude=location['latitude'],
-                        longitude=location['longitude'],
-                        tle_line1=satellite['tle_line1'],
-                        tle_line2=satellite['tle_line2'],
-                        start_time=start_time,
-                        end_time=end_time,
-                        elevation_threshold=elevation_threshold,
-                        time_step_seconds=time_step_seconds
+                    self._validate_access_inputs(
+                        location['latitude'], location['longitude'], start_time, end_time, elevation_threshold
                     )
+                    if propagation_error is not None:
+                        raise propagation_error
                     
-                    # Format windows data
-                    windows_data = []
-                    total_duration = 0.0
-                    max_elevation = 0.0
-                    
-                    for window in access_windows:
-                        window_dict = {
-                            "aos_time": window.aos_time.isoformat(),
-                            "los_time": window.los_time.isoformat(),
-                            "culmination_time": window.culmination_time.isoformat(),
-                            "duration_seconds": window.duration_seconds,
-                            "duration_minutes": round(window.duration_seconds / 60.0, 2),
-                            "max_elevation_deg": round(window.max_elevation_deg, 2),
-                            "aos_azimuth_deg": round(window.aos_azimuth_deg, 2),
-                            "los_azimuth_deg": round(window.los_azimuth_deg, 2),
-                            "culmination_azimuth_deg": round(window.culmination_azimuth_deg, 2),
-                            "ground_lighting": window.ground_lighting,
-                            "satellite_lighting": window.satellite_lighting
-                        }
-                        windows_data.append(window_dict)
-                        total_duration += window.duration_seconds
-                        max_elevation = max(max_elevation, window.max_elevation_deg)
-                    
-                    combination_result = {
-                        'satellite': satellite,
-                        'location': location,
-                        'access_windows': windows_data,
-                        'summary': {
-                            'total_windows': len(access_windows),
-                            'total_duration_seconds': total_duration,
-                            'total_duration_minutes': round(total_duration / 60.0, 2),
-                            'max_elevation_deg': round(max_elevation, 2)
-                        }
-                    }
+                    if positions is None:
+                        access_windows = AccessWindowArray.empty()
+                    else:
+                        if topocentric_km is None:
+                            # Every satellite's station-relative vector and sin(elevation) in one pass
+                            topocentric_km = positions - stations_km[i][:, np.newaxis]
+                            # einsum contracts in place, without norm()'s squared temporaries
+                            sin_elevation = np.einsum('k,skt->st', bases[i][2], topocentric_km)
+                            sin_elevation /= np.sqrt(np.einsum('skt,skt->st', topocentric_km, topocentric_km))
+                        access_windows = self._extract_access_windows(
+                            self._load_satellite(satellite['tle_line1'], satellite['tle_line2']),
+                            location['latitude'], location['longitude'], times,
+                            topocentric_km[j], elevation_threshold,
+                            basis=bases[i], sin_elevation=sin_elevation[j]
+                        )
                     
-                    results['results'].append(combination_result)
+                    yield self._bulk_combination_result(location, satellite, access_windows)
                     
                 except Exception as e:
                     logger.error(f"Error calculating windows for {satellite['name']} over {location['name']}: {str(e)}")
                     # Add error result
-                    combination_result = {
+                    yield {
                         'satellite': satellite,
                         'location': location,
                         'access_windows': [],
@@ -934,18 +1699,38 @@ class SatelliteCalculator:
                             'max_elevation_deg': 0
                         }
                     }
-                    results['results'].append(combination_result)
-        
-        # Calculate overall summary statistics
-        total_windows = sum(r['summary']['total_windows'] for r in results['results'])
-        total_duration = sum(r['summary']['total_duration_seconds'] for r in results['results'])
+    
+    def _summarize_windows(self, access_windows: AccessWindowArray) -> Tuple[List[Dict[str, Any]], float, float]:
+        """Format access windows for JSON output.
         
-        results['summary']['total_access_windows'] = total_windows
-        results['summary']['total_access_duration_seconds'] = total_duration
-        results['summary']['total_access_duration_minutes'] = round(total_duration / 60.0, 2)
+        Returns:
+            Tuple of (window dicts, total duration in seconds, highest elevation in degrees)
+        """
+        total_duration = sum(access_windows.duration_seconds.tolist(), 0.0)
+        # Windows only exist above the (non-negative) elevation threshold
+        max_elevation = max(access_windows.max_elevation_deg.tolist(), default=0.0)
+        return access_windows.to_dicts(), total_duration, max_elevation
+    
+    def _bulk_combination_result(
+        self,
+        location: Dict[str, Any],
+        satellite: Dict[str, Any],
+        access_windows: AccessWindowArray
+    ) -> Dict[str, Any]:
+        """Format the access windows of one location/satellite pair."""
+        windows_data, total_duration, max_elevation = self._summarize_windows(access_windows)
         
-        logger.info(f"Bulk calculation completed: {total_windows} total access windows found")
-        return results
+        return {
+            'satellite': satellite,
+            'location': location,
+            'access_windows': windows_data,
+            'summary': {
+                'total_windows': len(access_windows),
+                'total_duration_seconds': total_duration,
+                'total_duration_minutes': round(total_duration / 60.0, 2),
+                'max_elevation_deg': round(max_elevation, 2)
+            }
+        }
     
     def calculate_access_windows_by_city(
         self,
@@ -979,31 +1764,12 @@ class SatelliteCalculator:
             start_time=start_time,
             end_time=end_time,
             elevation_threshold=elevation_threshold,
-            time_step_seconds=time_step_seconds
+            time_step_seconds=time_step_seconds,
+            altitude=city_info["altitude"]
         )
         
         # Format response with city information
-        windows_data = []
-        total_duration = 0.0
-        max_elevation = 0.0
-        
-        for window in access_windows:
-            window_dict = {
-                "aos_time": window.aos_time.isoformat(),
-                "los_time": window.los_time.isoformat(),
-                "culmination_time": window.culmination_time.isoformat(),
-                "duration_seconds": window.duration_seconds,
-                "duration_minutes": round(window.duration_seconds / 60.0, 2),
-                "max_elevation_deg": round(window.max_elevation_deg, 2),
-                "aos_azimuth_deg": round(window.aos_azimuth_deg, 2),
-                "los_azimuth_deg": round(window.los_azimuth_deg, 2),
-                "culmination_azimuth_deg": round(window.culmination_azimuth_deg, 2),
-                "ground_lighting": window.ground_lighting,
-                "satellite_lighting": window.satellite_lighting
-            }
-            windows_data.append(window_dict)
-            total_duration += window.duration_seconds
-            max_elevation = max(max_elevation, window.max_elevation_deg)
+        windows_data, total_duration, max_elevation = self._summarize_windows(access_windows)
         
         response = {
             "city_info": {
@@ -1072,27 +1838,7 @@ class SatelliteCalculator:
         )
         
         # Format response with orbital elements information
-        windows_data = []
-        total_duration = 0.0
-        max_elevation = 0.0
-        
-        for window in access_windows:
-            window_dict = {
-                "aos_time": window.aos_time.isoformat(),
-                "los_time": window.los_time.isoformat(),
-                "culmination_time": window.culmination_time.isoformat(),
-                "duration_seconds": window.duration_seconds,
-                "duration_minutes": round(window.duration_seconds / 60.0, 2),
-                "max_elevation_deg": round(window.max_elevation_deg, 2),
-                "aos_azimuth_deg": round(window.aos_azimuth_deg, 2),
-                "los_azimuth_deg": round(window.los_azimuth_deg, 2),
-                "culmination_azimuth_deg": round(window.culmination_azimuth_deg, 2),
-                "ground_lighting": window.ground_lighting,
-                "satellite_lighting": window.satellite_lighting
-            }
-            windows_data.append(window_dict)
-            total_duration += window.duration_seconds
-            max_elevation = max(max_elevation, window.max_elevation_deg)
+        windows_data, total_duration, max_elevation = self._summarize_windows(access_windows)
         
         response = {
             "orbital_request": {
@@ -1175,7 +1921,7 @@ class SatelliteCalculator:
     def get_orbit_types(self) -> Dict[str, Any]:
         """Get available orbit types and their definitions."""
         return {
-            "orbit_types": ORBIT_TYPES,
+            "orbit_types": {name: dict(definition) for name, definition in ORBIT_TYPES.items()},
             "description": "Available orbit types for TLE generation from orbital elements"
         }
     
@@ -1234,20 +1980,22 @@ class SatelliteCalculator:
         Returns:
             Dict with satellite pair access windows
         """
-        ts = load.timescale()
-        start_ts = ts.from_datetime(start_time.replace(tzinfo=timezone.utc))
-        end_ts = ts.from_datetime(end_time.replace(tzinfo=timezone.utc))
+        self._validate_time_window(start_time, end_time)
+        if time_step_seconds <= 0:
+            raise ValueError(f"Invalid time step: {time_step_seconds}")
         
-        # Create satellite objects
+        start_ts = self.ts.from_datetime(start_time.replace(tzinfo=timezone.utc))
+        end_ts = self.ts.from_datetime(end_time.replace(tzinfo=timezone.utc))
+        
+        # Create satellite objects (shared with the other calculations through the cache)
         satellites = []
         for sat_data in satellite_tles:
             try:
-                satellite = EarthSatellite(
-                    sat_data['tle_line1'], 
-                    sat_data['tle_line2'],
-                    name=sat_data.get('name', 'Unknown'),
-                    ts=ts
-                )
+                # Checksum and format errors are caught (and cached) before any SGP4 setup
+                tle_validation = self._cached_validation(sat_data['tle_line1'], sat_data['tle_line2'])
+                if not tle_validation.is_valid:
+                    raise ValueError(f"Invalid TLE: {'; '.join(tle_validation.errors)}")
+                satellite = self._load_satellite(sat_data['tle_line1'], sat_data['tle_line2'])
                 satellites.append({'sat': satellite, 'name': sat_data.get('name', 'Unknown')})
             except Exception as e:
                 logger.error(f"Failed to create satellite from TLE: {e}")
@@ -1259,6 +2007,15 @@ class SatelliteCalculator:
                 "valid_satellites": len(satellites)
             }
         
+        # Generate one time array shared by every pair, and propagate each
+        # satellite over it once instead of once per pair
+        duration_seconds = (end_time - start_time).total_seconds()
+        num_steps = int(duration_seconds / time_step_seconds) + 1
+        times = start_ts + np.linspace(0, duration_seconds / 86400, num_steps)
+        for sat in satellites:
+            # Positions in km relative to Earth center
+            sat['position_km'] = sat['sat'].at(times).position.km
+        
         # Calculate all pairwise access windows
         all_results = []
         
@@ -1269,18 +2026,8 @@ class SatelliteCalculator:
                 
                 logger.info(f"Calculating access windows between {sat1['name']} and {sat2['name']}")
                 
-                # Generate time array
-                duration_seconds = (end_time - start_time).total_seconds()
-                num_steps = int(duration_seconds / time_step_seconds) + 1
-                times = start_ts + np.linspace(0, duration_seconds / 86400, num_steps)
-                
-                # Calculate positions for both satellites
-                pos1 = sat1['sat'].at(times)
-                pos2 = sat2['sat'].at(times)
-                
-                # Get positions in km relative to Earth center
-                pos1_km = pos1.position.km
-                pos2_km = pos2.position.km
+                pos1_km = sat1['position_km']
+                pos2_km = sat2['position_km']
                 
                 # Calculate separations and check occlusion
                 access_periods = []
@@ -1416,3 +2163,49 @@ class SatelliteCalculator:
             "satellite_pairs": all_results
         }
     
+
+
+# Bulk calculations with at least this many location/satellite combinations
+# are spread over a process pool; below it, worker start-up costs more than it
+# saves (propagation is vectorized, so a combination costs only milliseconds)
+BULK_PARALLEL_MIN_COMBINATIONS = 256
+
+# Approximate location/satellite combinations per process pool task; bounds
+# the size of each result list a worker sends back
+BULK_TASK_COMBINATIONS = 1024
+
+# Upper bound on location/satellite combinations accepted by one bulk calculation
+BULK_MAX_COMBINATIONS = 1_000_000
+
+# Calculator owned by each bulk worker process, created by _init_bulk_worker
+_worker_calculator = None
+
+
+def _init_bulk_worker():
+    """Create the worker process's calculator (timescale and ephemeris load once per worker)."""
+    global _worker_calculator
+    _worker_calculator = SatelliteCalculator()
+
+
+def _compute_bulk_chunk(args: Tuple) -> List[Dict[str, Any]]:
+    """Process pool entry point for one chunk of locations against all satellites."""
+    return list(_worker_calculator._bulk_location_chunk(*args))
+
+
+def _map_bounded(executor: ProcessPoolExecutor, fn: Callable, tasks: Iterator, window: int) -> Iterator:
+    """Like executor.map, but with at most ``window`` tasks submitted and unconsumed.
+    
+    Results are yielded in task order; closing the generator cancels the
+    tasks not yet started.
+    """
+    pending = collections.deque()
+    try:
+        for task in tasks:
+            if len(pending) >= window:
+                yield pending.popleft().result()
+            pending.append(executor.submit(fn, task))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()